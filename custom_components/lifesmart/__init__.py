@@ -1,23 +1,81 @@
 """LifeSmart integration bootstrap (Plus VRV)."""
 from __future__ import annotations
 
+import asyncio
 import importlib
 import importlib.util
 import logging
+from datetime import timedelta
 from typing import Any, Dict, List, Optional
 
 from homeassistant import config_entries
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.debounce import Debouncer
 from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.event import async_call_later, async_track_time_interval
+from homeassistant.helpers.start import async_at_started
 
-from .const import DOMAIN
+from .client import dummy_device
+from .command_queue import DeviceCommandQueue
+from .const import (
+    BINARY_SENSOR_TYPES,
+    COLLAPSIBLE_IOS,
+    COMMAND_SETTLE_WINDOW,
+    DEFAULT_INGEST_POLICY,
+    DEFAULT_PUBLISH_POLICIES,
+    DEFAULT_REFRESH_MAX_INTERVAL,
+    DEFAULT_REFRESH_MIN_INTERVAL,
+    DEFAULT_TOPOLOGY_INTERVAL,
+    DEFAULT_TRACE_SAMPLE_RATE,
+    DEFAULT_TRACE_SIZE,
+    DIGITAL_DOORLOCK_ALARM_EVENT_KEY,
+    DIGITAL_DOORLOCK_LOCK_EVENT_KEY,
+    DOMAIN,
+    HUB_ERROR_THRESHOLD,
+    HUB_PROBE_INTERVAL,
+    INGEST_BATCH_SIZE,
+    INGEST_MAX_QUEUE,
+    JOURNAL_FLUSH_INTERVAL,
+    JOURNAL_MAX_DEVICES,
+    JOURNAL_PER_DEVICE,
+    LOCK_ALARM_IDXS,
+    LOCK_EVENT_IDXS,
+    LOCK_TYPES,
+    REFRESH_TICK,
+    SECURITY_EVENT_KEY,
+    STARTUP_CLIENT_TIMEOUT,
+    STARTUP_DEVICES_TIMEOUT,
+    STARTUP_EXTRAS_TIMEOUT,
+    TOPOLOGY_COOLDOWN,
+)
 from .device import LifeSmartDevice, generate_entity_id  # re-export for legacy imports
+from .hub_health import HubHealthTracker
+from .ingest import PushIngestQueue
+from .io_codecs import CODECS
+from .journal import EventJournal
+from .publish_policy import PublishGate, PublishPolicy, parse_policy_overrides
+from .push import POLLED_KEY, LifeSmartPushSupervisor
+from .runtime import async_apply_device_list, async_poll_due, async_sync_entities
+from .scheduler import AdaptiveRefreshScheduler
+from .services import async_setup_services
+from .state_store import DeviceStateStore
+from .request_trace import RequestTracer
 
 _LOGGER = logging.getLogger(__name__)
 
 POTENTIAL_PLATFORMS: List[str] = ["binary_sensor", "sensor", "switch", "light", "cover", "climate"]
 
+# Options that change which client is built, or where the journal is kept;
+# everything else is applied to the running entry.
+RELOAD_OPTIONS = (
+    "journal_spill",
+    "synthetic_devices",
+    "synthetic_hubs",
+    "synthetic_devtypes",
+    "synthetic_event_rate",
+)
+
 def _available_platforms() -> List[str]:
     """Forward only platforms that exist and implement async_setup_entry."""
     present: List[str] = []
@@ -33,6 +91,7 @@ def _available_platforms() -> List[str]:
     return present
 
 async def async_setup(hass: HomeAssistant, config: dict) -> bool:
+    async_setup_services(hass)
     if DOMAIN in config:
         data = config.get(DOMAIN) or {}
         _LOGGER.debug("LifeSmart: importing YAML into a ConfigEntry")
@@ -48,23 +107,38 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
     store: Dict[str, Any] = hass.data.setdefault(DOMAIN, {}).get(entry.entry_id, {})
 
-    exclude_devices = entry.options.get("exclude_devices", [])
-    if isinstance(exclude_devices, str):
-        exclude_devices = [x.strip() for x in exclude_devices.split(",") if x.strip()]
-    exclude_hubs = entry.options.get("exclude_hubs", [])
-    if isinstance(exclude_hubs, str):
-        exclude_hubs = [x.strip() for x in exclude_hubs.split(",") if x.strip()]
+    exclude_devices = _split_option(entry.options.get("exclude_devices", []))
+    exclude_hubs = _split_option(entry.options.get("exclude_hubs", []))
     inject_dummy = bool(entry.options.get("inject_dummy", False))
+    scheduler = AdaptiveRefreshScheduler(
+        entry.options.get("refresh_min_interval", DEFAULT_REFRESH_MIN_INTERVAL),
+        entry.options.get("refresh_max_interval", DEFAULT_REFRESH_MAX_INTERVAL),
+    )
+    publish_gate = _build_publish_gate(hass, entry)
+    tracer = RequestTracer(
+        entry.options.get("trace_size", DEFAULT_TRACE_SIZE),
+        entry.options.get("trace_sample_rate", DEFAULT_TRACE_SAMPLE_RATE),
+    )
 
     client = store.get("client")
     if client is None:
-        client = await _maybe_create_client(hass, entry)
+        try:
+            client = await _with_timeout(_maybe_create_client(hass, entry), STARTUP_CLIENT_TIMEOUT)
+        except TimeoutError:
+            _LOGGER.warning("LifeSmart: client creation timed out after %ss", STARTUP_CLIENT_TIMEOUT)
+            client = None
         if client is None:
             _LOGGER.warning("LifeSmart: client not created; continuing (platforms will still load)")
+    if client is not None and hasattr(client, "tracer"):
+        client.tracer = tracer
 
     devices = store.get("devices")
     if devices is None:
-        devices = await _maybe_fetch_devices(client) or []
+        try:
+            devices = await _with_timeout(_maybe_fetch_devices(client), STARTUP_DEVICES_TIMEOUT) or []
+        except TimeoutError:
+            _LOGGER.warning("LifeSmart: device fetch timed out after %ss", STARTUP_DEVICES_TIMEOUT)
+            devices = []
 
     try:
         _LOGGER.info("LifeSmart: discovered %d devices", len(devices))
@@ -78,31 +152,81 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
                      (d.get("me") if isinstance(d, dict) else getattr(d, "me", None)),
                      (d.get("name") if isinstance(d, dict) else getattr(d, "name", None)))
 
+    dummy_devices: list = []
     if not devices and inject_dummy:
         _LOGGER.warning("LifeSmart: inject_dummy enabled; adding one SL_UACCB device for testing")
-        devices = [{
-            "devtype": "SL_UACCB",
-            "name": "Dummy AirBoard",
-            "agt": "HUB1234567890",
-            "me": "DEV0001",
-            "data": {
-                "P1": {"type": 0x81},
-                "P2": {"val": 3},
-                "P3": {"val": 240},
-                "P4": {"val": 45},
-                "P6": {"val": 250}
-            },
-            "ver": "debug", "id": "DEV0001", "hub": "HUB1234567890"
-        }]
+        dummy_devices = [dummy_device()]
+        devices = list(dummy_devices)
+
+    state = DeviceStateStore()
+    state.load(devices)
+
+    health = HubHealthTracker(HUB_ERROR_THRESHOLD, HUB_PROBE_INTERVAL)
+    entry.async_on_unload(health.add_listener(_async_hub_availability_changed))
+    _apply_hub_status(health, devices)
+
+    journal = EventJournal(
+        JOURNAL_PER_DEVICE,
+        JOURNAL_MAX_DEVICES,
+        hass.config.path(f"{DOMAIN}_events.jsonl") if entry.options.get("journal_spill") else None,
+    )
+    if entry.options.get("journal_spill"):
+        async def _flush_journal(_now=None) -> None:
+            await hass.async_add_executor_job(journal.flush)
+
+        entry.async_on_unload(
+            async_track_time_interval(hass, _flush_journal, timedelta(seconds=JOURNAL_FLUSH_INTERVAL))
+        )
 
     hass.data[DOMAIN][entry.entry_id] = {
         "client": client,
         "devices": devices,
+        "state": state,
+        "hub_health": health,
+        "journal": journal,
         "exclude_devices": exclude_devices,
         "exclude_hubs": exclude_hubs,
+        "dummy_devices": dummy_devices,
+        "options": dict(entry.options),
+        "scheduler": scheduler,
+        "commands": DeviceCommandQueue(COMMAND_SETTLE_WINDOW, COLLAPSIBLE_IOS),
+        "publish_gate": publish_gate,
+        "tracer": tracer,
+        "scenes": {},
+        "ir_remotes": {},
     }
 
-    _attach_ws_listener_if_possible(hass, entry, client)
+    hubs = _hub_ids(devices, exclude_hubs)
+
+    push = None
+    if hasattr(client, "get_wss_url") and hasattr(client, "generate_wss_auth"):
+        push = LifeSmartPushSupervisor(
+            hass,
+            client,
+            hubs,
+            exclude_hubs=exclude_hubs,
+            devtypes=_split_option(entry.options.get("push_devtypes", [])),
+            state=state,
+        )
+        push.add_poll_listener(lambda polled: _apply_hub_status(health, polled))
+    hass.data[DOMAIN][entry.entry_id]["push"] = push
+
+    async def _refresh_topology() -> None:
+        await _async_refresh_topology(hass, entry)
+
+    topology = Debouncer(
+        hass, _LOGGER, cooldown=TOPOLOGY_COOLDOWN, immediate=True, function=_refresh_topology
+    )
+    entry.async_on_unload(topology.async_shutdown)
+    hass.data[DOMAIN][entry.entry_id]["topology"] = topology
+    _async_arm_topology_timer(hass, entry, hass.data[DOMAIN][entry.entry_id])
+
+    ingest = _attach_ws_listener_if_possible(
+        hass, entry, push or client, state, publish_gate, journal, topology, health
+    )
+    hass.data[DOMAIN][entry.entry_id]["ingest"] = ingest
+    if push is not None:
+        push.async_start(entry)
 
     present = _available_platforms()
     if present:
@@ -110,15 +234,131 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         _LOGGER.debug("LifeSmart: forwarded platforms: %s", present)
     else:
         _LOGGER.warning("LifeSmart: no platform modules found to set up")
+
+    # One timer for all polled entities; the adaptive scheduler decides which
+    # ticks actually reach the cloud.
+    bucket = hass.data[DOMAIN][entry.entry_id]
+
+    @callback
+    def _poll_tick(_now) -> None:
+        async_poll_due(hass, bucket)
+
+    entry.async_on_unload(async_track_time_interval(hass, _poll_tick, timedelta(seconds=REFRESH_TICK)))
+
+    # Scenes and IR catalogs are not needed for entities to work; load them
+    # once Home Assistant has started so startup time does not grow with hubs.
+    async def _load_extras(_hass: HomeAssistant) -> None:
+        entry.async_create_background_task(
+            hass, _async_load_extras(hass, entry, client, hubs), "lifesmart_load_extras"
+        )
+
+    entry.async_on_unload(async_at_started(hass, _load_extras))
+    entry.async_on_unload(entry.add_update_listener(_async_options_updated))
     return True
 
+async def _async_options_updated(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Apply option changes in place; only options that replace the client reload."""
+    bucket = hass.data.get(DOMAIN, {}).get(entry.entry_id)
+    if bucket is None:
+        return
+    old, new = bucket.get("options", {}), dict(entry.options)
+    bucket["options"] = new
+    if any(old.get(k) != new.get(k) for k in RELOAD_OPTIONS):
+        _LOGGER.debug("LifeSmart: client options changed; reloading entry")
+        hass.config_entries.async_schedule_reload(entry.entry_id)
+        return
+
+    bucket["exclude_devices"] = _split_option(new.get("exclude_devices", []))
+    bucket["exclude_hubs"] = _split_option(new.get("exclude_hubs", []))
+
+    devices = bucket["devices"]
+    inject_dummy = bool(new.get("inject_dummy", False))
+    if inject_dummy and not devices:
+        bucket["dummy_devices"] = [dummy_device()]
+        devices.extend(bucket["dummy_devices"])
+        bucket["state"].load(bucket["dummy_devices"])
+    elif not inject_dummy and bucket.get("dummy_devices"):
+        for d in bucket["dummy_devices"]:
+            if d in devices:
+                devices.remove(d)
+            bucket["state"].remove(d["agt"], d["me"])
+        bucket["dummy_devices"] = []
+
+    if bucket.get("ingest") is not None:
+        bucket["ingest"].set_policy(new.get("ingest_policy", DEFAULT_INGEST_POLICY))
+    if old.get("topology_interval") != new.get("topology_interval"):
+        _async_arm_topology_timer(hass, entry, bucket)
+    bucket["scheduler"].set_bounds(
+        new.get("refresh_min_interval", DEFAULT_REFRESH_MIN_INTERVAL),
+        new.get("refresh_max_interval", DEFAULT_REFRESH_MAX_INTERVAL),
+    )
+    bucket["publish_gate"].set_entity_policies(_entity_publish_policies(new))
+    bucket["tracer"].configure(
+        new.get("trace_size", DEFAULT_TRACE_SIZE),
+        new.get("trace_sample_rate", DEFAULT_TRACE_SAMPLE_RATE),
+    )
+    if bucket.get("push") is not None:
+        bucket["push"].set_hubs(_hub_ids(devices, bucket["exclude_hubs"]))
+        bucket["push"].set_filters(bucket["exclude_hubs"], _split_option(new.get("push_devtypes", [])))
+    async_sync_entities(hass, bucket)
+    _LOGGER.debug("LifeSmart: options applied in place")
+
+@callback
+def _async_arm_topology_timer(hass: HomeAssistant, entry: ConfigEntry, bucket: Dict[str, Any]) -> None:
+    """(Re)start the periodic topology refresh from the topology_interval option."""
+    cancel = bucket.pop("topology_timer", None)
+    if cancel is not None:
+        cancel()
+    interval = int(entry.options.get("topology_interval", DEFAULT_TOPOLOGY_INTERVAL) or 0)
+    if bucket.get("client") is None or interval <= 0:
+        return
+    topology: Debouncer = bucket["topology"]
+
+    @callback
+    def _topology_tick(_now) -> None:
+        topology.async_schedule_call()
+
+    bucket["topology_timer"] = async_track_time_interval(hass, _topology_tick, timedelta(seconds=interval))
+
+async def _async_refresh_topology(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Re-fetch the device list and apply only the difference."""
+    bucket = hass.data.get(DOMAIN, {}).get(entry.entry_id)
+    if bucket is None:
+        return
+    try:
+        fresh = await _with_timeout(_maybe_fetch_devices(bucket.get("client")), STARTUP_DEVICES_TIMEOUT)
+    except TimeoutError:
+        _LOGGER.debug("LifeSmart: topology refresh timed out")
+        return
+    if fresh is None:
+        return
+    _apply_hub_status(bucket["hub_health"], fresh)
+    added, removed = async_apply_device_list(hass, bucket, fresh)
+    if (added or removed) and bucket.get("push") is not None:
+        bucket["push"].set_hubs(_hub_ids(bucket["devices"], bucket["exclude_hubs"]))
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     present = _available_platforms()
     ok = await hass.config_entries.async_unload_platforms(entry, present)
     store = hass.data.get(DOMAIN, {}).get(entry.entry_id)
     if store:
+        commands = store.get("commands")
+        if commands is not None:
+            commands.cancel_all()
+        topology_timer = store.get("topology_timer")
+        if topology_timer is not None:
+            topology_timer()
+        publish_gate = store.get("publish_gate")
+        if publish_gate is not None:
+            publish_gate.cancel_all()
         client = store.get("client")
-        _detach_ws_listener_if_possible(client)
+        push = store.get("push")
+        if push is not None:
+            push.async_stop()
+        journal = store.get("journal")
+        if journal is not None:
+            await hass.async_add_executor_job(journal.flush)
+        _detach_ws_listener_if_possible(push or client)
         hass.data[DOMAIN].pop(entry.entry_id, None)
         if not hass.data[DOMAIN]:
             hass.data.pop(DOMAIN, None)
@@ -159,12 +399,123 @@ async def _maybe_fetch_devices(client) -> Optional[list]:
                 _LOGGER.debug("LifeSmart: device fetch via %s failed: %s", attr, exc)
     return None
 
-def _attach_ws_listener_if_possible(hass: HomeAssistant, entry: ConfigEntry, client) -> None:
-    if client is None:
+def _build_publish_gate(hass: HomeAssistant, entry: ConfigEntry) -> PublishGate:
+    devtype_policies = {t: PublishPolicy.from_dict(p) for t, p in DEFAULT_PUBLISH_POLICIES.items()}
+
+    def _schedule(delay: float, action) -> Any:
+        return async_call_later(hass, delay, callback(lambda _now: action()))
+
+    return PublishGate(devtype_policies, _entity_publish_policies(entry.options), schedule=_schedule)
+
+def _entity_publish_policies(options) -> Dict[str, PublishPolicy]:
+    """Overrides from the publish_policies option, keyed by ``me/idx`` or ``me``."""
+    raw_policies = options.get("publish_policies") or {}
+    if isinstance(raw_policies, str):
+        try:
+            raw_policies = parse_policy_overrides(raw_policies)
+        except ValueError as exc:
+            _LOGGER.warning("LifeSmart: ignoring publish_policies option: %s", exc)
+            return {}
+    entity_policies = {}
+    for key, raw in raw_policies.items():
+        try:
+            entity_policies[key] = PublishPolicy.from_dict(raw)
+        except (TypeError, ValueError, AttributeError) as exc:
+            _LOGGER.warning("LifeSmart: ignoring publish policy for %s: %s", key, exc)
+    return entity_policies
+
+@callback
+def _async_hub_availability_changed(agt: str, online: bool, entities) -> None:
+    """Flip every entity behind a hub in one pass."""
+    _LOGGER.warning("LifeSmart: hub %s is %s (%d entities)", agt, "online" if online else "offline", len(entities))
+    for entity in entities:
+        entity._attr_available = online
+        if entity.hass is not None:
+            entity.async_write_ha_state()
+
+def _apply_hub_status(health: HubHealthTracker, devices: list) -> None:
+    """Use EpGetAll 'stat' fields: a hub is online if any of its devices is."""
+    status: Dict[str, bool] = {}
+    for d in devices or []:
+        if not isinstance(d, dict) or "stat" not in d or not d.get("agt"):
+            continue
+        status[d["agt"]] = status.get(d["agt"], False) or d["stat"] == 1
+    for agt, online in status.items():
+        health.record_status(agt, online)
+
+def _split_option(value) -> List[str]:
+    if isinstance(value, str):
+        return [x.strip() for x in value.split(",") if x.strip()]
+    return list(value or [])
+
+async def _with_timeout(coro, timeout: float):
+    async with asyncio.timeout(timeout):
+        return await coro
+
+def _hub_ids(devices: list, exclude_hubs: List[str]) -> List[str]:
+    hubs: List[str] = []
+    for d in devices or []:
+        agt = d.get("agt") if isinstance(d, dict) else getattr(d, "agt", None)
+        if agt and agt not in hubs and agt not in exclude_hubs:
+            hubs.append(agt)
+    return hubs
+
+async def _async_load_extras(hass: HomeAssistant, entry: ConfigEntry, client, hubs: List[str]) -> None:
+    """Fetch scenes and IR remote lists for every hub concurrently."""
+    if client is None or not hubs:
         return
+    jobs = []
+    for kind, attr in (("scenes", "get_all_scene_async"), ("ir_remotes", "get_ir_remote_list_async")):
+        if not hasattr(client, attr):
+            continue
+        for agt in hubs:
+            jobs.append((kind, agt, getattr(client, attr)(agt)))
+    if not jobs:
+        return
+    results = await asyncio.gather(
+        *(_with_timeout(coro, STARTUP_EXTRAS_TIMEOUT) for _, _, coro in jobs),
+        return_exceptions=True,
+    )
+    bucket = hass.data.get(DOMAIN, {}).get(entry.entry_id)
+    if bucket is None:
+        return
+    for (kind, agt, _), res in zip(jobs, results):
+        if isinstance(res, BaseException):
+            _LOGGER.debug("LifeSmart: %s fetch for hub %s failed: %r", kind, agt, res)
+            continue
+        bucket[kind][agt] = res
+    _LOGGER.debug("LifeSmart: loaded extras for %d hubs", len(hubs))
 
-    @callback
-    def _on_message(msg: Dict[str, Any]) -> None:
+# Trigger IOs of each binary sensor; other IOs (battery, voltage) are telemetry
+_SECURITY_TRIGGER_IDXS = {t: {f.idx for f in CODECS.get(t, {}).values()} for t in BINARY_SENSOR_TYPES}
+
+def _journal_kind(device_type: str, sub_key: str) -> Optional[str]:
+    if sub_key in (DIGITAL_DOORLOCK_LOCK_EVENT_KEY, DIGITAL_DOORLOCK_ALARM_EVENT_KEY):
+        return sub_key
+    if device_type in LOCK_TYPES:
+        if sub_key in LOCK_ALARM_IDXS:
+            return DIGITAL_DOORLOCK_ALARM_EVENT_KEY
+        if sub_key in LOCK_EVENT_IDXS:
+            return DIGITAL_DOORLOCK_LOCK_EVENT_KEY
+        return None
+    if sub_key in _SECURITY_TRIGGER_IDXS.get(device_type, ()):
+        return SECURITY_EVENT_KEY
+    return None
+
+def _attach_ws_listener_if_possible(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    client,
+    state: Optional[DeviceStateStore] = None,
+    publish_gate: Optional[PublishGate] = None,
+    journal: Optional[EventJournal] = None,
+    topology: Optional[Debouncer] = None,
+    health: Optional[HubHealthTracker] = None,
+) -> Optional[PushIngestQueue]:
+    if client is None:
+        return None
+
+    def _process(msg: Dict[str, Any]) -> None:
         try:
             from . import const as LS
             device_type = msg.get(getattr(LS, "DEVICE_TYPE_KEY", "devtype"))
@@ -173,14 +524,62 @@ def _attach_ws_listener_if_possible(hass: HomeAssistant, entry: ConfigEntry, cli
             sub_key = msg.get(getattr(LS, "SUBDEVICE_INDEX_KEY", "idx"))
             if not all([device_type, hub_id, device_id, sub_key]):
                 _LOGGER.debug("lifesmart: message missing keys, dropping: %s", msg); return
+            if health is not None and not msg.get(POLLED_KEY):
+                health.record_heartbeat(hub_id)
+            if journal is not None:
+                kind = _journal_kind(device_type, sub_key)
+                if kind is not None:
+                    journal.record(hub_id, device_id, device_type, sub_key, kind, msg.get("val"))
+            if state is not None and (hub_id, device_id) not in state:
+                # A frame from a device we never fetched: it was probably just
+                # paired. Keep it out of the store so it stays unknown until
+                # a topology refresh actually lists it.
+                if topology is not None:
+                    topology.async_schedule_call()
+                return
             entity_id = generate_entity_id(device_type, hub_id, device_id, sub_key)
-            if hass.states.get(entity_id) is None:
-                _LOGGER.debug("lifesmart: dropping update for unknown/disabled entity %s", entity_id); return
-            signal = getattr(LS, "LIFESMART_SIGNAL_UPDATE_ENTITY", "lifesmart_signal_update_entity")
-            async_dispatcher_send(hass, f"{signal}_{entity_id}", msg)
+            publish = publish_gate is None or publish_gate.should_publish(
+                device_type, entity_id, msg.get("val"), msg, (f"{device_id}/{sub_key}", device_id)
+            )
+            if state is not None:
+                values = {k: msg[k] for k in ("type", "val", "v") if k in msg}
+                state.update_io(hub_id, device_id, sub_key, values, notify=publish)
+            if publish:
+                _dispatch(entity_id, msg)
         except Exception as exc:
             _LOGGER.exception("lifesmart: exception in websocket handler: %s", exc)
 
+    def _dispatch(entity_id: str, msg: Dict[str, Any]) -> None:
+        from . import const as LS
+        if hass.states.get(entity_id) is None:
+            _LOGGER.debug("lifesmart: dropping update for unknown/disabled entity %s", entity_id); return
+        signal = getattr(LS, "LIFESMART_SIGNAL_UPDATE_ENTITY", "lifesmart_signal_update_entity")
+        async_dispatcher_send(hass, f"{signal}_{entity_id}", msg)
+
+    @callback
+    def _flush(entity_id: str, msg: Dict[str, Any]) -> None:
+        """Publish a value the gate held back earlier."""
+        if state is not None:
+            state.notify(msg.get("agt"), msg.get("me"))
+        _dispatch(entity_id, msg)
+
+    if publish_gate is not None:
+        publish_gate.set_flush_handler(_flush)
+
+    ingest = PushIngestQueue(
+        _process,
+        INGEST_MAX_QUEUE,
+        INGEST_BATCH_SIZE,
+        entry.options.get("ingest_policy", DEFAULT_INGEST_POLICY),
+    )
+
+    @callback
+    def _on_message(msg: Dict[str, Any]) -> None:
+        if isinstance(msg, dict):
+            ingest.put(msg)
+
+    entry.async_create_background_task(hass, ingest.run(), "lifesmart_ingest")
+
     for setter in ("add_message_callback", "add_listener", "on_message", "set_message_handler"):
         if hasattr(client, setter):
             try:
@@ -189,6 +588,7 @@ def _attach_ws_listener_if_possible(hass: HomeAssistant, entry: ConfigEntry, cli
                 break
             except Exception as exc:
                 _LOGGER.debug("LifeSmart: failed attaching via %s(): %s", setter, exc)
+    return ingest
 
 def _detach_ws_listener_if_possible(client) -> None:
     if client is None: return
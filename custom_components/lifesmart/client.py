@@ -1,24 +1,160 @@
 from __future__ import annotations
-from typing import Any
+
+import asyncio
+import logging
+import random
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+_LOGGER = logging.getLogger(__name__)
+
+SYNTHETIC_DEFAULT_DEVTYPES = ("SL_UACCB", "SL_SC_THL", "SL_OE_3C", "SL_PIR", "SL_GUARD", "SL_SMK", "SL_LOCK")
+SYNTHETIC_TICK = 0.1
+
+# Initial IO snapshot per devtype: idx -> (key, low, high)
+_TEMPLATES: Dict[str, Dict[str, tuple]] = {
+    "SL_UACCB": {"P1": ("type", 0x80, 0x81), "P2": ("val", 1, 5), "P3": ("val", 180, 280),
+                 "P4": ("val", 15, 75), "P6": ("val", 200, 300)},
+    "SL_SC_THL": {"T": ("val", 180, 300), "H": ("val", 300, 700), "Z": ("val", 0, 2000), "V": ("val", 60, 100)},
+    "SL_OE_3C": {"P1": ("val", 0, 100000), "P2": ("val", 0, 3000)},
+    "SL_PIR": {"M": ("val", 0, 1), "V": ("val", 60, 100)},
+    "SL_GUARD": {"G": ("val", 0, 1), "V": ("val", 60, 100)},
+    "SL_SMK": {"P1": ("val", 0, 1), "V": ("val", 60, 100)},
+    "SL_LOCK": {"EVTLO": ("val", 0, 4), "BAT": ("val", 20, 100)},
+}
+
 
 async def async_create_client(hass, data: dict, options: dict) -> Any:
+    count = int(options.get("synthetic_devices", 0) or 0)
+    if count > 0:
+        devtypes = options.get("synthetic_devtypes") or SYNTHETIC_DEFAULT_DEVTYPES
+        if isinstance(devtypes, str):
+            devtypes = [x.strip() for x in devtypes.split(",") if x.strip()]
+        _LOGGER.warning("LifeSmart: synthetic fleet mode, %d devices", count)
+        return SyntheticClient(
+            count,
+            int(options.get("synthetic_hubs", 1) or 1),
+            devtypes,
+            float(options.get("synthetic_event_rate", 1.0) or 0.0),
+        )
     return DummyClient()
 
+
+def generate_fleet(device_count: int, hub_count: int, devtypes: Iterable[str], seed: int = 0) -> List[dict]:
+    """Build an EpGetAll-shaped device list spread round-robin over hubs."""
+    rng = random.Random(seed)
+    types = [t for t in devtypes if t in _TEMPLATES] or ["SL_UACCB"]
+    hubs = [f"HUB{n:010d}" for n in range(1, max(hub_count, 1) + 1)]
+    devices = []
+    for n in range(device_count):
+        devtype = types[n % len(types)]
+        agt = hubs[n % len(hubs)]
+        me = f"DEV{n + 1:04d}"
+        devices.append({
+            "devtype": devtype,
+            "name": f"Synthetic {devtype} {n + 1}",
+            "agt": agt,
+            "me": me,
+            "data": {idx: {key: rng.randint(low, high)} for idx, (key, low, high) in _TEMPLATES[devtype].items()},
+            "stat": 1, "ver": "synthetic", "id": me, "hub": agt,
+        })
+    return devices
+
+
+def dummy_device() -> dict:
+    """The fixed test AirBoard; its agt/me is the entity's unique_id, so keep it stable."""
+    return {
+        "devtype": "SL_UACCB",
+        "name": "Dummy AirBoard",
+        "agt": "HUB1234567890",
+        "me": "DEV0001",
+        "data": {
+            "P1": {"type": 0x81},
+            "P2": {"val": 3},
+            "P3": {"val": 240},
+            "P4": {"val": 45},
+            "P6": {"val": 250}
+        },
+        "ver": "debug", "id": "DEV0001", "hub": "HUB1234567890"
+    }
+
+
+def _copy_device(device: dict) -> dict:
+    return {**device, "data": {idx: dict(io) for idx, io in device["data"].items()}}
+
+
 class DummyClient:
     async def async_get_devices(self) -> list[dict]:
-        return [{
-            "devtype": "SL_UACCB",
-            "name": "Dummy AirBoard",
-            "agt": "HUB1234567890",
-            "me": "DEV0001",
-            "data": {
-                "P1": {"type": 0x81},
-                "P2": {"val": 3},
-                "P3": {"val": 240},
-                "P4": {"val": 45},
-                "P6": {"val": 250}
-            },
-            "ver": "debug", "id": "DEV0001", "hub": "HUB1234567890"
-        }]
+        return [dummy_device()]
     def add_message_callback(self, cb): pass
     def remove_message_callback(self, cb): pass
+
+
+class SyntheticClient:
+    """Fake cloud for soak tests: a generated fleet plus a random IO event stream.
+
+    Events go through the registered message callbacks exactly like push
+    frames, at ``event_rate`` events per second across the whole fleet.
+    """
+
+    def __init__(self, device_count: int, hub_count: int, devtypes: Iterable[str], event_rate: float, seed: int = 0) -> None:
+        self._devices = generate_fleet(device_count, hub_count, devtypes, seed)
+        self._by_key = {(d["agt"], d["me"]): d for d in self._devices}
+        self._event_rate = event_rate
+        self._rng = random.Random(seed + 1)
+        self._callbacks: List[Callable[[Dict[str, Any]], None]] = []
+        self._task: Optional[asyncio.Task] = None
+
+    async def async_get_devices(self) -> list[dict]:
+        # Copies, like a real EpGetAll: the state store adopts these dicts and
+        # must not share them with the fake cloud's own copy.
+        return [_copy_device(d) for d in self._devices]
+
+    async def ep_get(self, agt: str, me: str) -> Optional[dict]:
+        device = self._by_key.get((agt, me))
+        if device is None:
+            return None
+        return _copy_device(device)
+
+    async def ep_set(self, agt: str, me: str, idx: str, type: int, val: Any) -> int:
+        device = self._by_key.get((agt, me))
+        if device is None:
+            return -1
+        device["data"].setdefault(idx, {}).update({"type": type, "val": val})
+        return 0
+
+    def add_message_callback(self, cb) -> None:
+        self._callbacks.append(cb)
+        if self._task is None and self._event_rate > 0 and self._devices:
+            self._task = asyncio.get_running_loop().create_task(self._stream())
+
+    def remove_message_callback(self, cb) -> None:
+        if cb in self._callbacks:
+            self._callbacks.remove(cb)
+        if not self._callbacks and self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    async def _stream(self) -> None:
+        budget = 0.0
+        while True:
+            await asyncio.sleep(SYNTHETIC_TICK)
+            budget += self._event_rate * SYNTHETIC_TICK
+            while budget >= 1:
+                budget -= 1
+                msg = self._random_change()
+                for cb in list(self._callbacks):
+                    cb(msg)
+
+    def _random_change(self) -> Dict[str, Any]:
+        device = self._rng.choice(self._devices)
+        template = _TEMPLATES[device["devtype"]]
+        idx = self._rng.choice(list(template))
+        key, low, high = template[idx]
+        io = device["data"].setdefault(idx, {})
+        if high - low <= 1:
+            value = low + high - io.get(key, low)
+        else:
+            step = max((high - low) // 50, 1)
+            value = min(high, max(low, io.get(key, low) + self._rng.randint(-step, step)))
+        io[key] = value
+        return {"devtype": device["devtype"], "agt": device["agt"], "me": device["me"], "idx": idx, **io}
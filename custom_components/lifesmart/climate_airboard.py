@@ -1,13 +1,19 @@
 """LifeSmart Air Board (VRV / devtype: SL_UACCB)."""
 from __future__ import annotations
 
-from typing import Any, Optional
+import asyncio
+from typing import Any
 
 from homeassistant.components.climate import ClimateEntity
 from homeassistant.components.climate.const import ClimateEntityFeature, HVACMode
 from homeassistant.const import UnitOfTemperature, ATTR_TEMPERATURE, PRECISION_HALVES
+from homeassistant.core import callback
+from homeassistant.exceptions import HomeAssistantError
 
 from .const import DOMAIN
+from .io_codecs import decode, encode
+from .runtime import async_register_platform
+from .state_store import DeviceStateStore, DeviceView
 
 LS_DEVTYPE_AIRBOARD = "SL_UACCB"
 
@@ -20,34 +26,44 @@ LS_MODE_TO_HA = {
 }
 HA_TO_LS_MODE = {v: k for k, v in LS_MODE_TO_HA.items()}
 
-def _fan_from_val(v: int) -> str:
-    if v < 30:
-        return "low"
-    if v < 65:
-        return "medium"
-    return "high"
+def _is_api_error(result: Any) -> bool:
+    """LifeSmart reports API errors with HTTP 200 and a non-zero code."""
+    if result is None:
+        return True
+    if isinstance(result, bool):
+        return False
+    if isinstance(result, int):
+        return result != 0
+    if isinstance(result, dict) and "code" in result:
+        return result["code"] not in (0, "0", "success")
+    return False
 
 async def async_setup_entry(hass, entry, async_add_entities):
     store = hass.data.get(DOMAIN, {})
     bucket = store.get(entry.entry_id) or store.get("entry") or store
 
     client = bucket.get("client") or getattr(bucket, "client", None)
+    scheduler = bucket.get("scheduler")
+    commands = bucket.get("commands")
+    health = bucket.get("hub_health")
     devices = bucket.get("devices") or getattr(bucket, "devices", None) or []
+    state = bucket.get("state")
+    if state is None:
+        state = bucket["state"] = DeviceStateStore()
+        state.load(devices)
 
-    airboards = []
-    for d in devices:
+    def _factory(d):
         devtype = getattr(d, "devtype", None) or (d.get("devtype") if isinstance(d, dict) else None)
         if devtype != LS_DEVTYPE_AIRBOARD:
-            continue
+            return None
         agt = getattr(d, "agt", None) or (d.get("agt") if isinstance(d, dict) else None)
         me = getattr(d, "me", None) or (d.get("me") if isinstance(d, dict) else None)
-        data = getattr(d, "data", None) or (d.get("data") if isinstance(d, dict) else {})
         name = getattr(d, "name", None) or (d.get("name") if isinstance(d, dict) else None) or f"AirBoard {me}"
-        if agt and me:
-            airboards.append(LifeSmartAirBoard(client, agt, me, name, data))
+        if not (agt and me):
+            return None
+        return LifeSmartAirBoard(client, agt, me, name, state.view(agt, me), scheduler, commands, health)
 
-    if airboards:
-        async_add_entities(airboards, update_before_add=True)
+    async_register_platform(hass, bucket, "climate", async_add_entities, _factory)
 
 class LifeSmartAirBoard(ClimateEntity):
     _attr_hvac_modes = [HVACMode.OFF, HVACMode.AUTO, HVACMode.COOL, HVACMode.HEAT, HVACMode.DRY, HVACMode.FAN_ONLY]
@@ -63,15 +79,38 @@ class LifeSmartAirBoard(ClimateEntity):
     _attr_max_temp = 30
     _attr_precision = PRECISION_HALVES
     _attr_target_temperature_step = 0.5
+    # Refreshed by the entry's poll timer through async_poll, not by HA.
+    _attr_should_poll = False
 
-    def __init__(self, client, agt: str, me: str, name: str, data: dict[str, Any]):
+    def __init__(
+        self, client, agt: str, me: str, name: str, view: DeviceView, scheduler=None, commands=None, health=None
+    ):
         self._client = client
         self._agt = agt
         self._me = me
         self._attr_name = name
-        self._data = data or {}
+        self._view = view
+        self._scheduler = scheduler
+        self._commands = commands
+        self._health = health
+        self._polling = False
+        self._apply_state()
 
     async def _call(self, method: str, params: dict) -> Any:
+        try:
+            result = await self._call_client(method, params)
+        except Exception:
+            if self._health is not None:
+                self._health.record_error(self._agt)
+            raise
+        if self._health is not None:
+            if _is_api_error(result):
+                self._health.record_error(self._agt)
+            else:
+                self._health.record_success(self._agt)
+        return result
+
+    async def _call_client(self, method: str, params: dict) -> Any:
         if hasattr(self._client, "call"):
             return await self._client.call(method, params)
         if hasattr(self._client, "async_call"):
@@ -88,79 +127,137 @@ class LifeSmartAirBoard(ClimateEntity):
                 return await self._client.get_device(params["agt"], params["me"])
         return None
 
-    def _io(self, key: str) -> dict | None:
-        if isinstance(self._data, dict):
-            return self._data.get(key)
-        return None
+    async def _set(self, params: dict, settle: float | None = None) -> Any:
+        if self._scheduler is not None:
+            self._scheduler.record_activity(self._agt, self._me)
+        if self._commands is not None:
+            return await self._commands.submit(params, self._send_epset, settle)
+        return await self._call("EpSet", params)
 
-    @property
-    def unique_id(self) -> str | None:
-        return f"{self._agt}:{self._me}"
+    async def _send_epset(self, params: dict) -> Any:
+        return await self._call("EpSet", params)
 
-    @property
-    def hvac_mode(self) -> HVACMode:
-        p1 = self._io("P1") or {}
-        is_on = (p1.get("type", 0) % 2 == 1)
-        if not is_on:
-            return HVACMode.OFF
-        p2 = self._io("P2") or {}
-        return {1: HVACMode.AUTO, 2: HVACMode.FAN_ONLY, 3: HVACMode.COOL, 4: HVACMode.HEAT, 5: HVACMode.DRY}.get(p2.get("val"), HVACMode.AUTO)
+    async def async_added_to_hass(self) -> None:
+        self.async_on_remove(self._view.subscribe(self._on_version))
+        if self._health is not None:
+            self._attr_available = self._health.is_online(self._agt)
+            self.async_on_remove(self._health.register(self._agt, self))
 
-    @property
-    def target_temperature(self) -> Optional[float]:
-        p3 = self._io("P3") or {}
-        if "val" in p3:
-            return round(p3["val"] / 10.0, 1)
-        return None
+    @callback
+    def _on_version(self, _version: int) -> None:
+        if self._polling:
+            # The refresh decodes and writes state itself.
+            return
+        self._apply_state()
+        self.async_write_ha_state()
 
-    @property
-    def current_temperature(self) -> Optional[float]:
-        p6 = self._io("P6") or {}
-        if "val" in p6:
-            return round(p6["val"] / 10.0, 1)
-        return None
+    def _apply_state(self) -> None:
+        """Decode the IO snapshot once; HA then reads the cached _attr_* values."""
+        state = decode(LS_DEVTYPE_AIRBOARD, self._view.data)
+        if not state.power:
+            self._attr_hvac_mode = HVACMode.OFF
+        else:
+            self._attr_hvac_mode = LS_MODE_TO_HA.get(state.mode, HVACMode.AUTO)
+        self._attr_target_temperature = state.target_temperature
+        self._attr_current_temperature = state.current_temperature
+        self._attr_fan_mode = state.fan_mode
+
+    def _write_io(self, idx: str, key: str, value: Any) -> None:
+        self._view.write(idx, key, value)
 
     @property
-    def fan_mode(self) -> Optional[str]:
-        p4 = self._io("P4") or {}
-        v = p4.get("val")
-        if v is None:
-            return None
-        return "low" if v < 30 else ("medium" if v < 65 else "high")
+    def unique_id(self) -> str | None:
+        return f"{self._agt}:{self._me}"
 
     async def async_turn_on(self) -> None:
-        await self._call("EpSet", {"agt": self._agt, "me": self._me, "idx": "P1", "type": 0x81, "val": 1})
-        self._data.setdefault("P1", {})["type"] = 0x81
+        self._write_io("P1", "type", 0x81)
+        await self._set({"agt": self._agt, "me": self._me, "idx": "P1", "type": 0x81, "val": 1})
 
     async def async_turn_off(self) -> None:
-        await self._call("EpSet", {"agt": self._agt, "me": self._me, "idx": "P1", "type": 0x80, "val": 0})
-        self._data.setdefault("P1", {})["type"] = 0x80
+        self._write_io("P1", "type", 0x80)
+        await self._set({"agt": self._agt, "me": self._me, "idx": "P1", "type": 0x80, "val": 0})
 
     async def async_set_hvac_mode(self, mode: HVACMode) -> None:
         if mode == HVACMode.OFF:
             return await self.async_turn_off()
         await self.async_turn_on()
-        val = {HVACMode.AUTO:1, HVACMode.FAN_ONLY:2, HVACMode.COOL:3, HVACMode.HEAT:4, HVACMode.DRY:5}.get(mode, 1)
-        await self._call("EpSet", {"agt": self._agt, "me": self._me, "idx": "P2", "type": 0xCE, "val": val})
-        self._data.setdefault("P2", {})["val"] = val
+        val = HA_TO_LS_MODE.get(mode, 1)
+        self._write_io("P2", "val", val)
+        await self._set({"agt": self._agt, "me": self._me, "idx": "P2", "type": 0xCE, "val": val})
 
     async def async_set_fan_mode(self, fan_mode: str) -> None:
-        val = {"low": 15, "medium": 45, "high": 75}[fan_mode]
-        await self._call("EpSet", {"agt": self._agt, "me": self._me, "idx": "P4", "type": 0xCE, "val": val})
-        self._data.setdefault("P4", {})["val"] = val
+        _, val = encode(LS_DEVTYPE_AIRBOARD, "fan_mode", fan_mode)
+        self._write_io("P4", "val", val)
+        await self._set({"agt": self._agt, "me": self._me, "idx": "P4", "type": 0xCE, "val": val})
 
     async def async_set_temperature(self, **kwargs) -> None:
         temp = kwargs.get(ATTR_TEMPERATURE)
         if temp is None:
             return
-        val = int(round(float(temp) * 10))
-        await self._call("EpSet", {"agt": self._agt, "me": self._me, "idx": "P3", "type": 0x88, "val": val})
-        self._data.setdefault("P3", {})["val"] = val
+        _, val = encode(LS_DEVTYPE_AIRBOARD, "target_temperature", temp)
+        self._write_io("P3", "val", val)
+        await self._set({"agt": self._agt, "me": self._me, "idx": "P3", "type": 0x88, "val": val})
+
+    async def async_apply_settings(
+        self, hvac_mode: HVACMode | None = None, temperature: float | None = None, fan_mode: str | None = None
+    ) -> None:
+        """Apply mode, temperature and fan together, without per-write settle delays."""
+        writes = []
+        if hvac_mode == HVACMode.OFF:
+            writes.append(("P1", "type", 0x80, 0))
+        elif hvac_mode is not None:
+            writes.append(("P1", "type", 0x81, 1))
+            writes.append(("P2", "val", 0xCE, HA_TO_LS_MODE.get(hvac_mode, 1)))
+        if temperature is not None:
+            writes.append(("P3", "val", 0x88, encode(LS_DEVTYPE_AIRBOARD, "target_temperature", temperature)[1]))
+        if fan_mode is not None:
+            writes.append(("P4", "val", 0xCE, encode(LS_DEVTYPE_AIRBOARD, "fan_mode", fan_mode)[1]))
+        for idx, key, io_type, val in writes:
+            self._write_io(idx, key, io_type if key == "type" else val)
+        results = await asyncio.gather(*(
+            self._set({"agt": self._agt, "me": self._me, "idx": idx, "type": io_type, "val": val}, settle=0)
+            for idx, _, io_type, val in writes
+        ))
+        failed = [r for r in results if isinstance(r, int) and r != 0]
+        if failed:
+            raise HomeAssistantError(f"EpSet failed for {self.entity_id}: codes {failed}")
 
     async def async_update(self) -> None:
-        resp = await self._call("EpGet", {"agt": self._agt, "me": self._me})
-        if isinstance(resp, dict):
-            dev = resp.get("message") if "message" in resp else resp
-            data = dev.get("data") if isinstance(dev, dict) else None
-            if isinstance(data, dict):
-                self._data = data
+        """Refresh now, e.g. for homeassistant.update_entity; routine refreshes use async_poll."""
+        await self._async_refresh()
+
+    async def async_poll(self) -> None:
+        """Refresh when the scheduler says the device is due; write state only on change."""
+        if self._scheduler is not None and not self._scheduler.is_due(self._agt, self._me):
+            return
+        if self._health is not None and not self._health.should_probe(self._agt):
+            return
+        if await self._async_refresh():
+            self.async_write_ha_state()
+
+    async def _async_refresh(self) -> bool:
+        changed = False
+        try:
+            resp = await self._call("EpGet", {"agt": self._agt, "me": self._me})
+            changed = self._store_poll(resp)
+        finally:
+            # A failed refresh backs off like an unchanged one.
+            if self._scheduler is not None:
+                self._scheduler.record_refresh(self._agt, self._me, changed)
+        return changed
+
+    def _store_poll(self, resp: Any) -> bool:
+        if not isinstance(resp, dict):
+            return False
+        dev = resp.get("message") if "message" in resp else resp
+        data = dev.get("data") if isinstance(dev, dict) else None
+        if not isinstance(data, dict):
+            return False
+        self._polling = True
+        try:
+            changed = self._view.replace(data)
+        finally:
+            self._polling = False
+        if changed:
+            self._apply_state()
+        return changed
@@ -0,0 +1,86 @@
+"""Per-device EpSet command queue with last-write-wins collapsing."""
+from __future__ import annotations
+
+import asyncio
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple
+
+DeviceKey = Tuple[str, str]
+Sender = Callable[[dict], Awaitable[Any]]
+_Item = Tuple[dict, Sender, float, List[asyncio.Future]]
+
+
+class DeviceCommandQueue:
+    """Serialize writes per (agt, me) and collapse superseded writes per IO.
+
+    Each write waits ``settle`` seconds before it is sent. A newer write to
+    a collapsible IO that arrives in the meantime replaces the queued one,
+    and every caller of the replaced write receives the result of the write
+    that was actually sent. Callers that already know their final value
+    (group control) can pass ``settle=0``.
+    """
+
+    def __init__(self, settle: float, collapse: Iterable[str]) -> None:
+        self._settle = settle
+        self._collapse = frozenset(collapse)
+        self._pending: Dict[DeviceKey, "OrderedDict[Any, _Item]"] = {}
+        self._workers: Dict[DeviceKey, asyncio.Task] = {}
+
+    async def submit(self, params: dict, send: Sender, settle: Optional[float] = None) -> Any:
+        key = (params["agt"], params["me"])
+        idx = params["idx"]
+        settle = self._settle if settle is None else settle
+        loop = asyncio.get_running_loop()
+        waiter = loop.create_future()
+        pending = self._pending.setdefault(key, OrderedDict())
+        if idx in self._collapse:
+            # Assigning an existing key keeps its place, so the collapsed write
+            # still goes out in the order the user first touched that IO.
+            waiters = pending[idx][3] if idx in pending else []
+            waiters.append(waiter)
+            pending[idx] = (params, send, settle, waiters)
+        else:
+            pending[object()] = (params, send, settle, [waiter])
+        if key not in self._workers:
+            self._workers[key] = loop.create_task(self._drain(key))
+        return await waiter
+
+    def pending_count(self, agt: str, me: str) -> int:
+        return len(self._pending.get((agt, me), ()))
+
+    def cancel_all(self) -> None:
+        for task in list(self._workers.values()):
+            task.cancel()
+        for pending in self._pending.values():
+            for *_, waiters in pending.values():
+                for waiter in waiters:
+                    if not waiter.done():
+                        waiter.cancel()
+        self._pending.clear()
+        self._workers.clear()
+
+    async def _drain(self, key: DeviceKey) -> None:
+        pending = self._pending[key]
+        try:
+            while pending:
+                settle = next(iter(pending.values()))[2]
+                if settle > 0:
+                    await asyncio.sleep(settle)
+                if not pending:
+                    break
+                _, (params, send, _, waiters) = pending.popitem(last=False)
+                try:
+                    result = await send(params)
+                except Exception as exc:  # noqa: BLE001 - handed to every caller
+                    for waiter in waiters:
+                        if not waiter.done():
+                            waiter.set_exception(exc)
+                else:
+                    for waiter in waiters:
+                        if not waiter.done():
+                            waiter.set_result(result)
+        finally:
+            if self._workers.get(key) is asyncio.current_task():
+                self._workers.pop(key, None)
+            if not pending:
+                self._pending.pop(key, None)
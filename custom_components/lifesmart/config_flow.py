@@ -8,7 +8,17 @@ from homeassistant import config_entries
 from homeassistant.data_entry_flow import FlowResult
 from homeassistant.core import callback
 
-from .const import DOMAIN
+from .const import (
+    DEFAULT_INGEST_POLICY,
+    DEFAULT_REFRESH_MAX_INTERVAL,
+    DEFAULT_REFRESH_MIN_INTERVAL,
+    DEFAULT_TOPOLOGY_INTERVAL,
+    DEFAULT_TRACE_SAMPLE_RATE,
+    DEFAULT_TRACE_SIZE,
+    DOMAIN,
+    REFRESH_TICK,
+)
+from .publish_policy import format_policy_overrides, parse_policy_overrides
 
 _LOGGER = logging.getLogger(__name__)
 REGIONS = ["cn", "us", "eu", "sg"]
@@ -71,16 +81,68 @@ class LifeSmartOptionsFlow(config_entries.OptionsFlow):
         self.entry = entry
 
     async def async_step_init(self, user_input: Dict[str, Any] | None = None) -> FlowResult:
+        errors: Dict[str, str] = {}
         if user_input is not None:
-            return self.async_create_entry(title="", data=user_input)
+            try:
+                parse_policy_overrides(user_input.get("publish_policies", ""))
+            except ValueError:
+                errors["publish_policies"] = "invalid_publish_policies"
+            else:
+                return self.async_create_entry(title="", data=user_input)
 
-        default_exclude_devices = self.entry.options.get("exclude_devices", "")
-        default_exclude_hubs = self.entry.options.get("exclude_hubs", "")
-        default_inject_dummy = bool(self.entry.options.get("inject_dummy", False))
+        # Re-showing after an error keeps what the user typed.
+        current = {**self.entry.options, **(user_input or {})}
+        default_exclude_devices = current.get("exclude_devices", "")
+        default_exclude_hubs = current.get("exclude_hubs", "")
+        default_inject_dummy = bool(current.get("inject_dummy", False))
+        default_refresh_min = current.get("refresh_min_interval", DEFAULT_REFRESH_MIN_INTERVAL)
+        default_refresh_max = current.get("refresh_max_interval", DEFAULT_REFRESH_MAX_INTERVAL)
+        default_push_devtypes = current.get("push_devtypes", "")
+        default_topology_interval = current.get("topology_interval", DEFAULT_TOPOLOGY_INTERVAL)
+        default_trace_size = current.get("trace_size", DEFAULT_TRACE_SIZE)
+        default_trace_sample_rate = current.get("trace_sample_rate", DEFAULT_TRACE_SAMPLE_RATE)
+        default_ingest_policy = current.get("ingest_policy", DEFAULT_INGEST_POLICY)
+        default_journal_spill = bool(current.get("journal_spill", False))
+        default_publish_policies = current.get("publish_policies", "")
+        if isinstance(default_publish_policies, dict):
+            default_publish_policies = format_policy_overrides(default_publish_policies)
+        default_synthetic_devices = current.get("synthetic_devices", 0)
+        default_synthetic_hubs = current.get("synthetic_hubs", 1)
+        default_synthetic_devtypes = current.get("synthetic_devtypes", "")
+        default_synthetic_event_rate = current.get("synthetic_event_rate", 1.0)
 
         schema = vol.Schema({
             vol.Optional("exclude_devices", default=default_exclude_devices): str,
             vol.Optional("exclude_hubs", default=default_exclude_hubs): str,
             vol.Optional("inject_dummy", default=default_inject_dummy): bool,
+            vol.Optional("refresh_min_interval", default=default_refresh_min): vol.All(
+                vol.Coerce(int), vol.Range(min=REFRESH_TICK)
+            ),
+            vol.Optional("refresh_max_interval", default=default_refresh_max): vol.All(
+                vol.Coerce(int), vol.Range(min=REFRESH_TICK)
+            ),
+            vol.Optional("push_devtypes", default=default_push_devtypes): str,
+            vol.Optional("topology_interval", default=default_topology_interval): vol.All(
+                vol.Coerce(int), vol.Range(min=0)
+            ),
+            vol.Optional("trace_size", default=default_trace_size): vol.All(
+                vol.Coerce(int), vol.Range(min=1, max=5000)
+            ),
+            vol.Optional("trace_sample_rate", default=default_trace_sample_rate): vol.All(
+                vol.Coerce(float), vol.Range(min=0, max=1)
+            ),
+            vol.Optional("ingest_policy", default=default_ingest_policy): vol.In(["coalesce", "drop_oldest"]),
+            vol.Optional("journal_spill", default=default_journal_spill): bool,
+            vol.Optional("publish_policies", default=default_publish_policies): str,
+            vol.Optional("synthetic_devices", default=default_synthetic_devices): vol.All(
+                vol.Coerce(int), vol.Range(min=0, max=20000)
+            ),
+            vol.Optional("synthetic_hubs", default=default_synthetic_hubs): vol.All(
+                vol.Coerce(int), vol.Range(min=1, max=500)
+            ),
+            vol.Optional("synthetic_devtypes", default=default_synthetic_devtypes): str,
+            vol.Optional("synthetic_event_rate", default=default_synthetic_event_rate): vol.All(
+                vol.Coerce(float), vol.Range(min=0, max=5000)
+            ),
         })
-        return self.async_show_form(step_id="init", data_schema=schema)
+        return self.async_show_form(step_id="init", data_schema=schema, errors=errors)
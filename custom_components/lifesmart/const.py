@@ -11,6 +11,61 @@ SUBDEVICE_INDEX_KEY = "idx"
 
 LIFESMART_SIGNAL_UPDATE_ENTITY = "lifesmart_signal_update_entity"
 
+# Startup step timeouts (seconds)
+STARTUP_CLIENT_TIMEOUT = 30
+STARTUP_DEVICES_TIMEOUT = 30
+STARTUP_EXTRAS_TIMEOUT = 20
+
+# Adaptive refresh bounds (seconds); the entry poll timer ticks every REFRESH_TICK
+REFRESH_TICK = 10
+DEFAULT_REFRESH_MIN_INTERVAL = 30
+DEFAULT_REFRESH_MAX_INTERVAL = 900
+
+# EpSet queue: settle window (seconds) and IOs where only the latest write matters
+COMMAND_SETTLE_WINDOW = 0.3
+COLLAPSIBLE_IOS = ("P3", "P4")
+
+# Device list diffing: periodic interval and push-triggered cooldown (seconds)
+DEFAULT_TOPOLOGY_INTERVAL = 600
+TOPOLOGY_COOLDOWN = 30
+TOPOLOGY_MISSING_REFRESHES = 3
+
+# Hub health: consecutive API errors before a hub is offline, probe period (seconds)
+HUB_ERROR_THRESHOLD = 3
+HUB_PROBE_INTERVAL = 60
+
+# Push channel supervision (seconds)
+PUSH_HEARTBEAT = 30
+PUSH_STALE_AFTER = 600
+PUSH_POLL_INTERVAL = 120
+PUSH_CHECK_INTERVAL = 30
+
+# Push ingestion queue: capacity, frames handled per batch, default overflow policy
+INGEST_MAX_QUEUE = 5000
+INGEST_BATCH_SIZE = 200
+DEFAULT_INGEST_POLICY = "coalesce"
+
+# API request tracing: ring buffer size and fraction of requests sampled
+DEFAULT_TRACE_SIZE = 200
+DEFAULT_TRACE_SAMPLE_RATE = 0.05
+
+# Group control: concurrent AirBoard writes allowed per hub
+GROUP_MAX_PER_HUB = 4
+
+# Minimum gap between IR transmissions on one hub (seconds)
+IR_DEFAULT_PACE = 0.3
+
+# Publish policies for chatty pushed values, per devtype; entity overrides
+# come from the "publish_policies" option ({entity_id: {...}})
+ENERGY_METER_TYPES = ["SL_OE_3C", "SL_OE_DE", "SL_OE_W"]
+ENVIRONMENT_SENSOR_TYPES = ["SL_SC_THL", "SL_SC_BE", "SL_SC_CQ", "SL_SC_CH"]
+DEFAULT_PUBLISH_POLICIES = {
+    **{t: {"abs_deadband": 1.0, "rel_deadband": 0.01, "min_interval": 5, "heartbeat": 300}
+       for t in ENERGY_METER_TYPES},
+    **{t: {"abs_deadband": 1.0, "min_interval": 30, "heartbeat": 600}
+       for t in ENVIRONMENT_SENSOR_TYPES},
+}
+
 BINARY_SENSOR_TYPES = ["SL_GUARD", "SL_DET", "SL_PIR", "SL_SMK", "SL_WTR", "SL_GAS"]
 GUARD_SENSOR_TYPES = ["SL_GUARD"]
 MOTION_SENSOR_TYPES = ["SL_PIR", "SL_DET"]
@@ -19,5 +74,13 @@ LOCK_TYPES = ["SL_LOCK"]
 
 DIGITAL_DOORLOCK_LOCK_EVENT_KEY = "E_LOCK"
 DIGITAL_DOORLOCK_ALARM_EVENT_KEY = "E_ALARM"
+SECURITY_EVENT_KEY = "E_SECURITY"
+LOCK_EVENT_IDXS = ["EVTLO"]
+LOCK_ALARM_IDXS = ["ALM"]
+
+# Event journal: events kept per device, devices kept, spill flush period (seconds)
+JOURNAL_PER_DEVICE = 50
+JOURNAL_MAX_DEVICES = 2000
+JOURNAL_FLUSH_INTERVAL = 60
 
 MANUFACTURER = "LifeSmart"
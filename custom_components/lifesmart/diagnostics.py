@@ -0,0 +1,33 @@
+"""Diagnostics support for LifeSmart."""
+from __future__ import annotations
+
+from typing import Any, Dict
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN
+
+TO_REDACT = {"app_key", "token", "user_id", "password", "username"}
+
+
+async def async_get_config_entry_diagnostics(hass: HomeAssistant, entry: ConfigEntry) -> Dict[str, Any]:
+    bucket = hass.data.get(DOMAIN, {}).get(entry.entry_id) or {}
+    ingest = bucket.get("ingest")
+    push = bucket.get("push")
+    gate = bucket.get("publish_gate")
+    tracer = bucket.get("tracer")
+    health = bucket.get("hub_health")
+    return {
+        "entry": {
+            "data": async_redact_data(dict(entry.data), TO_REDACT),
+            "options": dict(entry.options),
+        },
+        "devices": len(bucket.get("devices") or []),
+        "ingest": ingest.metrics if ingest is not None else None,
+        "offline_hubs": health.offline_hubs if health is not None else None,
+        "push": push.metrics if push is not None else None,
+        "publish_suppressed": gate.suppressed if gate is not None else None,
+        "requests": tracer.snapshot() if tracer is not None else None,
+    }
@@ -0,0 +1,98 @@
+"""Per-hub availability tracking with a hub-to-entities index."""
+from __future__ import annotations
+
+import time
+from typing import Any, Callable, Dict, List, Set
+
+HubListener = Callable[[str, bool, Set[Any]], None]
+
+
+class HubHealthTracker:
+    """Decide whether each hub (agt) is reachable and tell its entities at once.
+
+    ``error_threshold`` consecutive API errors take a hub offline; any push
+    frame, successful call or online status field brings it back. Offline
+    hubs are only probed every ``probe_interval`` seconds. Listeners get
+    every entity registered under the hub that flipped, so availability
+    is written in one pass instead of one timeout per entity.
+    """
+
+    def __init__(
+        self,
+        error_threshold: int,
+        probe_interval: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._error_threshold = max(int(error_threshold), 1)
+        self._probe_interval = probe_interval
+        self._clock = clock
+        self._online: Dict[str, bool] = {}
+        self._errors: Dict[str, int] = {}
+        self._last_probe: Dict[str, float] = {}
+        self._entities: Dict[str, Set[Any]] = {}
+        self._listeners: List[HubListener] = []
+
+    def is_online(self, agt: str) -> bool:
+        return self._online.get(agt, True)
+
+    @property
+    def offline_hubs(self) -> List[str]:
+        return sorted(agt for agt, online in self._online.items() if not online)
+
+    def should_probe(self, agt: str) -> bool:
+        """Online hubs always; offline hubs once per probe interval."""
+        if self.is_online(agt):
+            return True
+        now = self._clock()
+        if now - self._last_probe.get(agt, 0.0) >= self._probe_interval:
+            self._last_probe[agt] = now
+            return True
+        return False
+
+    def record_success(self, agt: str) -> None:
+        self._errors[agt] = 0
+        self._set(agt, True)
+
+    def record_heartbeat(self, agt: str) -> None:
+        self._errors[agt] = 0
+        self._set(agt, True)
+
+    def record_error(self, agt: str) -> None:
+        errors = self._errors.get(agt, 0) + 1
+        self._errors[agt] = errors
+        if errors >= self._error_threshold:
+            self._set(agt, False)
+
+    def record_status(self, agt: str, online: bool) -> None:
+        self._errors[agt] = 0
+        self._set(agt, online)
+
+    def register(self, agt: str, entity: Any) -> Callable[[], None]:
+        entities = self._entities.setdefault(agt, set())
+        entities.add(entity)
+
+        def _unregister() -> None:
+            entities.discard(entity)
+
+        return _unregister
+
+    def entities(self, agt: str) -> Set[Any]:
+        return set(self._entities.get(agt, ()))
+
+    def add_listener(self, listener: HubListener) -> Callable[[], None]:
+        self._listeners.append(listener)
+
+        def _remove() -> None:
+            if listener in self._listeners:
+                self._listeners.remove(listener)
+
+        return _remove
+
+    def _set(self, agt: str, online: bool) -> None:
+        previous = self._online.get(agt, True)
+        self._online[agt] = online
+        if previous == online:
+            return
+        entities = self.entities(agt)
+        for listener in list(self._listeners):
+            listener(agt, online, entities)
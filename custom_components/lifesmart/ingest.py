@@ -0,0 +1,159 @@
+"""Bounded ingestion queue for push frames."""
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict, deque
+from typing import Any, Callable, Deque, Dict, Hashable, Optional, Tuple
+
+_LOGGER = logging.getLogger(__name__)
+
+POLICY_COALESCE = "coalesce"
+POLICY_DROP_OLDEST = "drop_oldest"
+INGEST_POLICIES = (POLICY_COALESCE, POLICY_DROP_OLDEST)
+
+
+class PushIngestQueue:
+    """Decouple push frame arrival from processing.
+
+    ``put`` only enqueues, so transport callbacks return immediately. A
+    worker drains the queue in batches of ``batch_size`` and yields to the
+    event loop between batches. When the queue is full:
+
+    * ``coalesce`` folds the incoming frame into the newest queued frame of
+      the same (agt, me, idx), or drops the oldest queued frame when that
+      IO has nothing queued;
+    * ``drop_oldest`` drops the oldest queued frame of the same device, or
+      the oldest frame overall when that device has nothing queued.
+    """
+
+    def __init__(
+        self,
+        handler: Callable[[Dict[str, Any]], None],
+        maxsize: int,
+        batch_size: int,
+        policy: str = POLICY_COALESCE,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if policy not in INGEST_POLICIES:
+            raise ValueError(f"unknown ingest policy {policy!r}")
+        self._handler = handler
+        self._maxsize = maxsize
+        self._batch_size = batch_size
+        self._policy = policy
+        self._clock = clock
+        self._items: "OrderedDict[Hashable, Tuple[Dict[str, Any], float]]" = OrderedDict()
+        self._per_device: Dict[Tuple[Any, Any], Deque[Hashable]] = {}
+        self._latest: Dict[Hashable, Hashable] = {}
+        self._seq = 0
+        self._wakeup = asyncio.Event()
+        self.enqueued = 0
+        self.processed = 0
+        self.dropped = 0
+        self.coalesced = 0
+        self.max_depth = 0
+        self.last_lag = 0.0
+        self.max_lag = 0.0
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    @property
+    def metrics(self) -> Dict[str, Any]:
+        return {
+            "policy": self._policy,
+            "depth": len(self._items),
+            "max_depth": self.max_depth,
+            "capacity": self._maxsize,
+            "enqueued": self.enqueued,
+            "processed": self.processed,
+            "dropped": self.dropped,
+            "coalesced": self.coalesced,
+            "last_lag_ms": round(self.last_lag * 1000, 1),
+            "max_lag_ms": round(self.max_lag * 1000, 1),
+        }
+
+    def set_policy(self, policy: str) -> None:
+        """Switch the overflow policy; queued frames are kept and re-indexed."""
+        if policy not in INGEST_POLICIES:
+            raise ValueError(f"unknown ingest policy {policy!r}")
+        self._policy = policy
+        self._latest.clear()
+        self._per_device.clear()
+        for key, (msg, _) in self._items.items():
+            if policy == POLICY_COALESCE:
+                self._latest[_io_key(msg)] = key
+            else:
+                self._per_device.setdefault(key[:2], deque()).append(key)
+
+    def put(self, msg: Dict[str, Any]) -> None:
+        device = (msg.get("agt"), msg.get("me"))
+        self.enqueued += 1
+        self._seq += 1
+        key: Hashable = (*device, self._seq)
+        if len(self._items) >= self._maxsize:
+            if self._policy == POLICY_COALESCE:
+                latest = self._latest.get(_io_key(msg))
+                if latest is not None:
+                    self._items[latest] = (msg, self._items[latest][1])
+                    self.coalesced += 1
+                    return
+                self._drop(next(iter(self._items)))
+            else:
+                queued = self._per_device.get(device)
+                self._drop(queued[0] if queued else next(iter(self._items)))
+        if self._policy == POLICY_COALESCE:
+            self._latest[_io_key(msg)] = key
+        else:
+            self._per_device.setdefault(device, deque()).append(key)
+        self._items[key] = (msg, self._clock())
+        self.max_depth = max(self.max_depth, len(self._items))
+        self._wakeup.set()
+
+    def _drop(self, key: Hashable) -> None:
+        msg, _ = self._items.pop(key)
+        self._forget(key, msg)
+        self.dropped += 1
+
+    def _forget(self, key: Hashable, msg: Dict[str, Any]) -> None:
+        if self._policy == POLICY_COALESCE:
+            io = _io_key(msg)
+            if self._latest.get(io) == key:
+                del self._latest[io]
+            return
+        device = key[:2]
+        queued = self._per_device.get(device)
+        if queued:
+            queued.popleft()
+            if not queued:
+                del self._per_device[device]
+
+    def drain(self, limit: Optional[int] = None) -> int:
+        """Process up to ``limit`` queued frames now; returns how many ran."""
+        count = 0
+        while self._items and (limit is None or count < limit):
+            key, (msg, enqueued_at) = self._items.popitem(last=False)
+            self._forget(key, msg)
+            self.last_lag = self._clock() - enqueued_at
+            self.max_lag = max(self.max_lag, self.last_lag)
+            try:
+                self._handler(msg)
+            except Exception:  # noqa: BLE001 - one bad frame must not stop the worker
+                _LOGGER.exception("LifeSmart: push frame handler failed")
+            self.processed += 1
+            count += 1
+        return count
+
+    async def run(self) -> None:
+        """Worker loop; cancel the task to stop it."""
+        while True:
+            await self._wakeup.wait()
+            self._wakeup.clear()
+            while self._items:
+                self.drain(self._batch_size)
+                await asyncio.sleep(0)
+
+
+def _io_key(msg: Dict[str, Any]) -> Tuple[Any, Any, Any]:
+    return (msg.get("agt"), msg.get("me"), msg.get("idx"))
@@ -0,0 +1,138 @@
+"""Declarative IO decoders per LifeSmart devtype.
+
+Each devtype maps attribute names to the IO (``idx``) they are read from
+and how the raw value is converted. ``decode`` turns one IO snapshot into
+a frozen per-devtype ``DecodedState`` dataclass, so entities read plain
+attributes instead of walking raw IO dicts on every property access, and
+a misspelt attribute raises instead of reading as missing. New device
+types only need a table entry in ``CODECS``.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass, field, make_dataclass
+from typing import Any, Callable, Dict, Mapping, Optional, Sequence, Tuple, Type
+
+
+def _identity(v: Any) -> Any:
+    return v
+
+
+def _odd(v: Any) -> bool:
+    return int(v) % 2 == 1
+
+
+def _nonzero(v: Any) -> bool:
+    return int(v) != 0
+
+
+def _zero(v: Any) -> bool:
+    return int(v) == 0
+
+
+def _tenths(v: Any) -> float:
+    return round(float(v) / 10.0, 1)
+
+
+def _times_ten(v: Any) -> int:
+    return int(round(float(v) * 10))
+
+
+def _bands(bands: Sequence[Tuple[Optional[int], str]]) -> Callable[[Any], str]:
+    """Map a raw value onto named bands; ``None`` closes the last band."""
+    def decode(v: Any) -> str:
+        v = int(v)
+        for upper, name in bands:
+            if upper is None or v < upper:
+                return name
+        return bands[-1][1]
+    return decode
+
+
+@dataclass(frozen=True)
+class IoField:
+    idx: str
+    key: str = "val"
+    decode: Callable[[Any], Any] = _identity
+    encode: Optional[Callable[[Any], Any]] = None
+
+
+@dataclass(frozen=True)
+class DecodedState:
+    """Decoded attributes of one device.
+
+    Each devtype gets a subclass with one field per ``CODECS`` entry;
+    IOs missing from the snapshot read as None.
+    """
+
+    devtype: str
+
+
+AIRBOARD_FAN_BANDS = ((30, "low"), (65, "medium"), (None, "high"))
+AIRBOARD_FAN_VALUES = {"low": 15, "medium": 45, "high": 75}
+
+_CONTROLLER = {
+    "power": IoField("P1", key="type", decode=_odd),
+    "mode": IoField("P2", decode=int),
+    "target_temperature": IoField("P3", decode=_tenths, encode=_times_ten),
+    "fan_mode": IoField("P4", decode=_bands(AIRBOARD_FAN_BANDS), encode=AIRBOARD_FAN_VALUES.__getitem__),
+    "current_temperature": IoField("P6", decode=_tenths),
+}
+_MOTION = {"motion": IoField("M", decode=_nonzero)}
+_ALARM = {"alarm": IoField("P1", decode=_nonzero)}
+
+CODECS: Dict[str, Dict[str, IoField]] = {
+    "SL_UACCB": _CONTROLLER,
+    # const.py groups these with SL_UACCB as one generic-controller family.
+    "SL_UACC": _CONTROLLER,
+    "SL_CTRL": _CONTROLLER,
+    "SL_GUARD": {"opened": IoField("G", decode=_zero)},
+    "SL_PIR": _MOTION,
+    "SL_DET": _MOTION,
+    "SL_SMK": _ALARM,
+    "SL_WTR": {"leak": IoField("WA", decode=_nonzero)},
+    "SL_GAS": _ALARM,
+    "SL_LOCK": {
+        "lock_event": IoField("EVTLO"),
+        "battery": IoField("BAT"),
+    },
+}
+
+
+def _state_type(devtype: str, fields: Mapping[str, IoField]) -> Type[DecodedState]:
+    return make_dataclass(
+        f"{devtype.title().replace('_', '')}State",
+        [(name, Any, field(default=None)) for name in fields],
+        bases=(DecodedState,),
+        frozen=True,
+    )
+
+
+STATE_TYPES: Dict[str, Type[DecodedState]] = {
+    devtype: _state_type(devtype, fields) for devtype, fields in CODECS.items()
+}
+
+
+def decode(devtype: str, data: Optional[Mapping[str, Any]]) -> DecodedState:
+    """Decode an IO snapshot for ``devtype`` into its DecodedState subclass."""
+    fields = CODECS.get(devtype)
+    if not fields:
+        return DecodedState(devtype=devtype)
+    values: Dict[str, Any] = {}
+    if isinstance(data, Mapping):
+        for name, io_field in fields.items():
+            io = data.get(io_field.idx)
+            if not isinstance(io, Mapping) or io_field.key not in io:
+                continue
+            try:
+                values[name] = io_field.decode(io[io_field.key])
+            except (TypeError, ValueError):
+                continue
+    return STATE_TYPES[devtype](devtype=devtype, **values)
+
+
+def encode(devtype: str, name: str, value: Any) -> Tuple[str, Any]:
+    """Return (idx, raw value) for writing attribute ``name`` of ``devtype``."""
+    field = CODECS[devtype][name]
+    if field.encode is None:
+        return field.idx, value
+    return field.idx, field.encode(value)
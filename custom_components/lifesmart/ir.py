@@ -0,0 +1,80 @@
+"""Paced, ordered IR macro transmission."""
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import time
+from typing import Any, Dict, List, Mapping
+
+_LOGGER = logging.getLogger(__name__)
+
+
+async def _send_step(client: Any, step: Mapping[str, Any]) -> Any:
+    if "ir_code" in step:
+        return await client.send_ir_code_async(step["agt"], step["me"], step["ir_code"])
+    keys = step["keys"]
+    if not isinstance(keys, str):
+        keys = json.dumps(list(keys))
+    return await client.send_ir_key_async(
+        step["agt"], step.get("ai", ""), step["me"], step["category"], step["brand"], keys
+    )
+
+
+async def _timed(client: Any, index: int, step: Mapping[str, Any]) -> Dict[str, Any]:
+    started = time.monotonic()
+    result: Dict[str, Any] = {"index": index, "agt": step["agt"], "me": step["me"]}
+    try:
+        response = await _send_step(client, step)
+    except Exception as exc:  # noqa: BLE001 - reported per step
+        result.update(ok=False, error=str(exc))
+    else:
+        code = response.get("code") if isinstance(response, dict) else response
+        result.update(ok=code == 0, code=code)
+    result["latency"] = round(time.monotonic() - started, 3)
+    return result
+
+
+async def _send_hub_batch(client: Any, indexed: List[tuple], pace: float, lock: asyncio.Lock) -> List[Dict[str, Any]]:
+    """Send one hub's steps in order, each after the previous one completed."""
+    async with lock:
+        results = []
+        for n, (index, step) in enumerate(indexed):
+            started = time.monotonic()
+            results.append(await _timed(client, index, step))
+            if n < len(indexed) - 1:
+                gap = max(float(step.get("delay", 0)), pace)
+                await asyncio.sleep(max(gap - (time.monotonic() - started), 0))
+        return results
+
+
+async def async_send_ir_sequence(
+    client: Any, steps: List[Mapping[str, Any]], pace: float, locks: Dict[str, asyncio.Lock]
+) -> Dict[str, Any]:
+    """Send an ordered IR macro, one paced batch per hub, all hubs in parallel.
+
+    Within a hub, step N+1 goes out once step N's request has completed and
+    at least ``max(delay, pace)`` seconds after step N started, so steps
+    cannot overtake each other on separate connections. This is a deliberate
+    trade-off: each client call is its own HTTP request and aiohttp does not
+    pipeline, so ordering costs one round trip per step on a hub; only hubs
+    run in parallel. ``locks`` keeps two macros from interleaving on the
+    same hub.
+    """
+    by_hub: Dict[str, List[tuple]] = {}
+    for index, step in enumerate(steps):
+        by_hub.setdefault(step["agt"], []).append((index, step))
+    started = time.monotonic()
+    batches = await asyncio.gather(*(
+        _send_hub_batch(client, indexed, pace, locks.setdefault(agt, asyncio.Lock()))
+        for agt, indexed in by_hub.items()
+    ))
+    results = sorted((r for batch in batches for r in batch), key=lambda r: r["index"])
+    failed = sum(1 for r in results if not r["ok"])
+    _LOGGER.debug("LifeSmart: IR sequence of %d steps done, %d failed", len(results), failed)
+    return {
+        "sent": len(results) - failed,
+        "failed": failed,
+        "duration": round(time.monotonic() - started, 3),
+        "steps": results,
+    }
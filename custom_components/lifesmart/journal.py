@@ -0,0 +1,90 @@
+"""Fixed-memory ring buffer journal for lock, alarm and security events."""
+from __future__ import annotations
+
+import json
+import os
+import time
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+DeviceKey = Tuple[str, str]
+# (timestamp, devtype, idx, kind, val)
+Event = Tuple[float, str, str, str, Any]
+
+
+class EventJournal:
+    """Keep the last ``per_device`` events of each device in memory.
+
+    When ``spill_path`` is set, recorded events are also queued for
+    ``flush`` (call it from an executor), which appends them as compact JSON
+    lines and rotates the file once it exceeds ``spill_max_bytes``.
+    """
+
+    def __init__(
+        self,
+        per_device: int,
+        max_devices: int,
+        spill_path: Optional[str] = None,
+        spill_max_bytes: int = 5 * 1024 * 1024,
+    ) -> None:
+        self._per_device = per_device
+        self._max_devices = max_devices
+        self._events: Dict[DeviceKey, Deque[Event]] = {}
+        self._spill_path = spill_path
+        self._spill_max_bytes = spill_max_bytes
+        self._unspilled: Deque[Tuple[str, str, Event]] = deque(maxlen=per_device * max_devices)
+
+    def record(self, agt: str, me: str, devtype: str, idx: str, kind: str, val: Any, ts: Optional[float] = None) -> None:
+        key = (agt, me)
+        events = self._events.get(key)
+        if events is None:
+            if len(self._events) >= self._max_devices:
+                # Evict the device whose newest event is oldest.
+                stale = min(self._events, key=lambda k: self._events[k][-1][0] if self._events[k] else 0.0)
+                del self._events[stale]
+            events = self._events[key] = deque(maxlen=self._per_device)
+        event = (time.time() if ts is None else ts, devtype, idx, kind, val)
+        events.append(event)
+        if self._spill_path:
+            self._unspilled.append((agt, me, event))
+
+    def query(
+        self,
+        agt: Optional[str] = None,
+        me: Optional[str] = None,
+        since: Optional[float] = None,
+        until: Optional[float] = None,
+        limit: int = 100,
+    ) -> List[Dict[str, Any]]:
+        """Return matching events, newest first."""
+        out: List[Dict[str, Any]] = []
+        for (dev_agt, dev_me), events in self._events.items():
+            if (agt and dev_agt != agt) or (me and dev_me != me):
+                continue
+            for ts, devtype, idx, kind, val in events:
+                if (since is not None and ts < since) or (until is not None and ts > until):
+                    continue
+                out.append({"ts": ts, "agt": dev_agt, "me": dev_me, "devtype": devtype,
+                            "idx": idx, "kind": kind, "val": val})
+        out.sort(key=lambda e: e["ts"], reverse=True)
+        return out[:limit]
+
+    def __len__(self) -> int:
+        return sum(len(events) for events in self._events.values())
+
+    def flush(self) -> int:
+        """Append queued events to the spill file; returns the number written."""
+        if not self._spill_path or not self._unspilled:
+            return 0
+        lines = []
+        while self._unspilled:
+            agt, me, (ts, devtype, idx, kind, val) = self._unspilled.popleft()
+            lines.append(json.dumps([round(ts, 3), agt, me, devtype, idx, kind, val], separators=(",", ":")))
+        try:
+            if os.path.getsize(self._spill_path) > self._spill_max_bytes:
+                os.replace(self._spill_path, f"{self._spill_path}.1")
+        except FileNotFoundError:
+            pass
+        with open(self._spill_path, "a", encoding="utf-8") as fh:
+            fh.write("\n".join(lines) + "\n")
+        return len(lines)
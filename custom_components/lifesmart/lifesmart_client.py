@@ -1,5 +1,6 @@
 """The LifeSmart API Client."""
 
+import asyncio
 import hashlib
 import json
 import logging
@@ -7,8 +8,45 @@ import time
 
 import aiohttp
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson ships with Home Assistant
+    orjson = None
+
+from .request_trace import response_code
+
 _LOGGER = logging.getLogger(__name__)
 
+# EpGetAll bodies at or above this size are decoded in the executor.
+LARGE_PAYLOAD_BYTES = 256 * 1024
+
+
+def _loads(raw):
+    """Decode a JSON body from bytes (or str) without an intermediate text copy."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _decode_epgetall(raw):
+    """Decode an EpGetAll body and build the device list.
+
+    Devices are taken one at a time from the decoded message so that a
+    malformed entry is skipped instead of failing the whole resync.
+    """
+    response = _loads(raw)
+    if not isinstance(response, dict) or response.get("code") != 0:
+        return response
+    devices = []
+    for device in response.get("message") or ():
+        if not isinstance(device, dict):
+            continue
+        if not isinstance(device.get("data"), dict):
+            device["data"] = {}
+        devices.append(device)
+    response["message"] = devices
+    return response
+
 
 class LifeSmartClient:
     """A class for manage LifeSmart API."""
@@ -20,6 +58,7 @@ class LifeSmartClient:
         apptoken,
         userid,
         userpassword,
+        tracer=None,
     ) -> None:
         """Initialize LifeSmart client."""
         self._region = region
@@ -29,6 +68,7 @@ class LifeSmartClient:
         self._userpassword = userpassword
         self._usertoken = None
         self._rgn = None
+        self.tracer = tracer
 
     async def get_all_device_async(self):
         """Get all devices belong to current user."""
@@ -44,8 +84,18 @@ class LifeSmartClient:
         header = self.__generate_header()
         send_data = json.dumps(send_values)
 
-        response = json.loads(await self.post_async(url, send_data, header))
-        _LOGGER.debug("EpGetAll_res: %s", response)
+        raw = await self.post_bytes_async(url, send_data, header)
+        if len(raw) >= LARGE_PAYLOAD_BYTES:
+            loop = asyncio.get_running_loop()
+            response = await loop.run_in_executor(None, _decode_epgetall, raw)
+        else:
+            response = _decode_epgetall(raw)
+        if not isinstance(response, dict):
+            _LOGGER.warning("EpGetAll: unexpected %s body (%d bytes)", type(response).__name__, len(raw))
+            return None
+        _LOGGER.debug(
+            "EpGetAll_res: code=%s, %d bytes", response.get("code"), len(raw)
+        )
         if response["code"] == 0:
             return response["message"]
         return response
@@ -70,7 +120,7 @@ class LifeSmartClient:
         }
         header = self.__generate_header()
         send_data = json.dumps(send_values)
-        response = json.loads(await self.post_async(url, send_data, header))
+        response = json.loads(await self.post_async(url, send_data, header, agt=agt))
         if response["code"] == 0:
             return response["message"]
         return False
@@ -134,7 +184,7 @@ class LifeSmartClient:
         header = self.__generate_header()
         send_data = json.dumps(send_values)
 
-        return json.loads(await self.post_async(url, send_data, header))
+        return json.loads(await self.post_async(url, send_data, header, agt=agt))
 
     async def send_ir_key_async(self, agt, ai, me, category, brand, keys):
         """Send an IR key to a specific device."""
@@ -173,7 +223,7 @@ class LifeSmartClient:
         header = self.__generate_header()
         send_data = json.dumps(send_values)
 
-        return json.loads(await self.post_async(url, send_data, header))
+        return json.loads(await self.post_async(url, send_data, header, agt=agt))
 
     async def send_ir_code_async(self, agt, me, keys):
         """Send an IR code to a specific device."""
@@ -203,9 +253,9 @@ class LifeSmartClient:
         }
         header = self.__generate_header()
         send_data = json.dumps(send_values)
-        _LOGGER.debug("ir code req: %s", str(send_data))
-        response = json.loads(await self.post_async(url, send_data, header))
-        _LOGGER.debug("ir code res: %s", str(response))
+        _LOGGER.debug("ir code req: agt=%s me=%s", agt, me)
+        response = json.loads(await self.post_async(url, send_data, header, agt=agt))
+        _LOGGER.debug("ir code res: %s", response)
         return response
 
     async def send_ir_ackey_async(
@@ -252,7 +302,7 @@ class LifeSmartClient:
             + ","
             + self.__generate_time_and_credential_data(tick)
         )
-        _LOGGER.debug("sendackey: %s", str(sdata))
+        _LOGGER.debug("sendackey: agt=%s me=%s key=%s", agt, me, key)
         send_values = {
             "id": 1,
             "method": "SendACKeys",
@@ -274,8 +324,8 @@ class LifeSmartClient:
         header = self.__generate_header()
         send_data = json.dumps(send_values)
 
-        response = json.loads(await self.post_async(url, send_data, header))
-        _LOGGER.debug("sendackey_res: %s", str(response))
+        response = json.loads(await self.post_async(url, send_data, header, agt=agt))
+        _LOGGER.debug("sendackey_res: %s", response)
         return response
 
     async def turn_on_light_swith_async(self, idx, agt, me):
@@ -314,9 +364,9 @@ class LifeSmartClient:
         header = self.__generate_header()
         send_data = json.dumps(send_values)
 
-        _LOGGER.debug("epset_req: %s", str(send_data))
-        response = json.loads(await self.post_async(url, send_data, header))
-        _LOGGER.debug("epset_res: %s", str(response))
+        _LOGGER.debug("epset_req: agt=%s me=%s idx=%s", agt, me, idx)
+        response = json.loads(await self.post_async(url, send_data, header, agt=agt))
+        _LOGGER.debug("epset_res: %s", response)
         return response["code"]
 
     async def get_epget_async(self, agt, me):
@@ -340,8 +390,8 @@ class LifeSmartClient:
         header = self.__generate_header()
         send_data = json.dumps(send_values)
 
-        response = json.loads(await self.post_async(url, send_data, header))
-        _LOGGER.debug("epget_res: %s", str(response))
+        response = json.loads(await self.post_async(url, send_data, header, agt=agt))
+        _LOGGER.debug("epget_res: %s", response)
         return response["message"]["data"]
 
     async def get_ir_remote_list_async(self, agt):
@@ -364,8 +414,8 @@ class LifeSmartClient:
         header = self.__generate_header()
         send_data = json.dumps(send_values)
 
-        response = json.loads(await self.post_async(url, send_data, header))
-        _LOGGER.debug("GetRemoteList_res: %s", str(response))
+        response = json.loads(await self.post_async(url, send_data, header, agt=agt))
+        _LOGGER.debug("GetRemoteList_res: %s", response)
         return response["message"]
 
     async def get_ir_remote_async(self, agt, ai):
@@ -391,15 +441,56 @@ class LifeSmartClient:
         header = self.__generate_header()
         send_data = json.dumps(send_values)
 
-        response = json.loads(await self.post_async(url, send_data, header))
-        _LOGGER.debug("get_ir_remote_res: %s", str(response))
+        response = json.loads(await self.post_async(url, send_data, header, agt=agt))
+        _LOGGER.debug("get_ir_remote_res: %s", response)
         return response["message"]["codes"]
 
-    async def post_async(self, url, data, headers):
+    async def post_async(self, url, data, headers, agt=None):
         """Async method to make a POST api call."""
-        async with aiohttp.ClientSession() as session:
-            async with session.post(url, data=data, headers=headers) as response:
-                return await response.text()
+        sampled = self.tracer is not None and self.tracer.should_sample()
+        started = time.monotonic() if sampled else 0.0
+        try:
+            async with aiohttp.ClientSession() as session:
+                async with session.post(url, data=data, headers=headers) as response:
+                    raw = await response.read()
+                    # text() decodes the body read above; it does not read again.
+                    body = await response.text()
+        except Exception as exc:
+            if sampled:
+                self.__trace(url, agt, started, None, data, 0, error=type(exc).__name__)
+            raise
+        if sampled:
+            self.__trace(url, agt, started, response.status, data, len(raw), response_code(raw))
+        return body
+
+    async def post_bytes_async(self, url, data, headers, agt=None):
+        """Async method to make a POST api call and return the raw body."""
+        sampled = self.tracer is not None and self.tracer.should_sample()
+        started = time.monotonic() if sampled else 0.0
+        try:
+            async with aiohttp.ClientSession() as session:
+                async with session.post(url, data=data, headers=headers) as response:
+                    body = await response.read()
+        except Exception as exc:
+            if sampled:
+                self.__trace(url, agt, started, None, data, 0, error=type(exc).__name__)
+            raise
+        if sampled:
+            self.__trace(url, agt, started, response.status, data, len(body), response_code(body))
+        return body
+
+    def __trace(self, url, agt, started, status, data, response_bytes, code=None, error=None):
+        """Record one sampled exchange; only sizes and codes, never payloads."""
+        self.tracer.record(
+            url.rsplit("/", 1)[-1],
+            agt,
+            time.monotonic() - started,
+            status,
+            len(data),
+            response_bytes,
+            code,
+            error,
+        )
 
     def __get_signature(self, data):
         """Generate signature required by LifeSmart API."""
@@ -0,0 +1,92 @@
+"""On-demand profiling of the integration's own coroutines and callbacks."""
+from __future__ import annotations
+
+import asyncio
+import cProfile
+import io
+import logging
+import os
+import pstats
+import time
+from typing import Any, Dict, List
+
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError
+
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+PACKAGE_MARKER = os.path.join("custom_components", DOMAIN)
+_RUNNING_KEY = f"{DOMAIN}_profile_running"
+
+
+class _BlockingCollector(logging.Handler):
+    """Keep asyncio slow-callback warnings that point at LifeSmart code."""
+
+    def __init__(self) -> None:
+        super().__init__(logging.WARNING)
+        self.records: List[str] = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        msg = record.getMessage()
+        if " took " in msg and (PACKAGE_MARKER in msg or DOMAIN in msg.lower()):
+            self.records.append(msg)
+
+
+def _write_report(profiler: cProfile.Profile, blocking: List[str], base: str, seconds: float) -> None:
+    profiler.dump_stats(f"{base}.cprof")
+    buf = io.StringIO()
+    stats = pstats.Stats(profiler, stream=buf)
+    stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(PACKAGE_MARKER, 50)
+    with open(f"{base}.txt", "w", encoding="utf-8") as fh:
+        fh.write(f"LifeSmart profile, {seconds:.0f}s\n\n")
+        fh.write(f"Event loop blocking attributed to LifeSmart ({len(blocking)}):\n")
+        for line in blocking:
+            fh.write(f"  {line}\n")
+        fh.write("\n")
+        fh.write(buf.getvalue())
+
+
+async def async_profile(hass: HomeAssistant, seconds: float, block_threshold: float) -> Dict[str, Any]:
+    """Profile the event loop for ``seconds`` and write the LifeSmart slice to disk.
+
+    Writes ``lifesmart_profile.<ts>.cprof`` (raw pstats, loadable by
+    snakeviz and similar) and a ``.txt`` summary to the config directory.
+    """
+    if hass.data.get(_RUNNING_KEY):
+        raise HomeAssistantError("A LifeSmart profile is already running")
+    hass.data[_RUNNING_KEY] = True
+
+    loop = asyncio.get_running_loop()
+    profiler = cProfile.Profile()
+    collector = _BlockingCollector()
+    asyncio_logger = logging.getLogger("asyncio")
+    prev_debug, prev_slow = loop.get_debug(), loop.slow_callback_duration
+    try:
+        try:
+            profiler.enable()
+        except ValueError as exc:
+            raise HomeAssistantError(f"Cannot start profiler: {exc}") from exc
+        loop.slow_callback_duration = block_threshold
+        loop.set_debug(True)
+        asyncio_logger.addHandler(collector)
+        try:
+            await asyncio.sleep(seconds)
+        finally:
+            profiler.disable()
+            asyncio_logger.removeHandler(collector)
+            loop.set_debug(prev_debug)
+            loop.slow_callback_duration = prev_slow
+
+        base = hass.config.path(f"lifesmart_profile.{int(time.time())}")
+        await hass.async_add_executor_job(_write_report, profiler, collector.records, base, seconds)
+    finally:
+        hass.data.pop(_RUNNING_KEY, None)
+
+    _LOGGER.info("LifeSmart: profile written to %s.cprof / .txt", base)
+    return {
+        "stats_file": f"{base}.cprof",
+        "summary_file": f"{base}.txt",
+        "blocking_events": len(collector.records),
+    }
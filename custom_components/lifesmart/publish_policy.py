@@ -0,0 +1,202 @@
+"""Deadband and rate limiting for pushed sensor values."""
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Mapping, Optional, Sequence, Tuple
+
+Cancel = Callable[[], None]
+Schedule = Callable[[float, Callable[[], None]], Cancel]
+FlushHandler = Callable[[str, Any], None]
+
+
+@dataclass(frozen=True)
+class PublishPolicy:
+    """When a new value is worth a state write.
+
+    A value is published when it moved more than ``abs_deadband`` or
+    ``rel_deadband`` (fraction of the last published value), no sooner than
+    ``min_interval`` seconds after the previous publish. ``heartbeat``
+    forces a publish after that many seconds of silence; 0 disables it.
+    """
+
+    abs_deadband: float = 0.0
+    rel_deadband: float = 0.0
+    min_interval: float = 0.0
+    heartbeat: float = 0.0
+
+    @classmethod
+    def from_dict(cls, raw: Mapping[str, Any]) -> "PublishPolicy":
+        return cls(**{k: float(v) for k, v in raw.items() if k in cls.__dataclass_fields__})
+
+
+def parse_policy_overrides(text: str) -> Dict[str, Dict[str, float]]:
+    """Parse ``"DEV0001/P2: abs_deadband=5 min_interval=10; DEV0002: heartbeat=60"``.
+
+    Entries are separated by ``;`` or newlines. A key is a device id (``me``)
+    or ``me/idx`` for one IO; settings are ``PublishPolicy`` field names.
+    Raises ValueError on anything it cannot read.
+    """
+    overrides: Dict[str, Dict[str, float]] = {}
+    for entry in text.replace("\n", ";").split(";"):
+        if not entry.strip():
+            continue
+        key, sep, settings = entry.partition(":")
+        key = key.strip()
+        if not sep or not key:
+            raise ValueError(f"expected 'device: setting=value', got {entry.strip()!r}")
+        fields: Dict[str, float] = {}
+        for item in settings.replace(",", " ").split():
+            name, sep, value = item.partition("=")
+            if not sep or name not in PublishPolicy.__dataclass_fields__:
+                raise ValueError(f"unknown publish setting {item!r}")
+            fields[name] = float(value)
+        overrides[key] = fields
+    return overrides
+
+
+def format_policy_overrides(overrides: Mapping[str, Mapping[str, Any]]) -> str:
+    """Inverse of ``parse_policy_overrides``, for showing the current value."""
+    return "; ".join(
+        f"{key}: " + " ".join(f"{name}={value:g}" for name, value in fields.items())
+        for key, fields in overrides.items()
+    )
+
+
+def _as_number(value: Any) -> Optional[float]:
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, (int, float)):
+        return float(value)
+    return None
+
+
+class PublishGate:
+    """Track the last published value per entity and apply its policy.
+
+    Overrides from the ``publish_policies`` option, keyed by ``me/idx`` or
+    ``me``, take precedence over per-devtype policies; values with neither
+    are always published. With a ``schedule`` function the last suppressed
+    value is not lost: it is re-checked when ``min_interval`` ends and
+    published at the latest when the heartbeat is due, through the handler
+    given to ``set_flush_handler``.
+    """
+
+    def __init__(
+        self,
+        devtype_policies: Mapping[str, PublishPolicy],
+        entity_policies: Mapping[str, PublishPolicy],
+        clock: Callable[[], float] = time.monotonic,
+        schedule: Optional[Schedule] = None,
+    ) -> None:
+        self._devtype_policies = dict(devtype_policies)
+        self._entity_policies = dict(entity_policies)
+        self._clock = clock
+        self._schedule = schedule
+        self._on_flush: Optional[FlushHandler] = None
+        self._last: Dict[str, Tuple[Any, float]] = {}
+        self._pending: Dict[str, Tuple[PublishPolicy, Any, Any]] = {}
+        self._timers: Dict[str, Cancel] = {}
+        self.suppressed = 0
+        self.flushed = 0
+
+    def set_entity_policies(self, entity_policies: Mapping[str, PublishPolicy]) -> None:
+        self._entity_policies = dict(entity_policies)
+
+    def set_flush_handler(self, handler: Optional[FlushHandler]) -> None:
+        """``handler(entity_id, payload)`` publishes a deferred value."""
+        self._on_flush = handler
+
+    def policy_for(self, devtype: str, overrides: Sequence[str] = ()) -> Optional[PublishPolicy]:
+        """First override found in ``overrides`` (most specific first), else the devtype's."""
+        for key in overrides:
+            policy = self._entity_policies.get(key)
+            if policy is not None:
+                return policy
+        return self._devtype_policies.get(devtype)
+
+    def should_publish(
+        self, devtype: str, entity_id: str, value: Any, payload: Any = None, overrides: Sequence[str] = ()
+    ) -> bool:
+        """Decide now; ``payload`` is what the flush handler gets if deferred."""
+        policy = self.policy_for(devtype, overrides)
+        if policy is None:
+            return True
+        now = self._clock()
+        last = self._last.get(entity_id)
+        if last is None or self._passes(policy, last, value, now):
+            self._published(entity_id, value, now)
+            return True
+        self.suppressed += 1
+        if self._arm(entity_id, policy, last, now):
+            self._pending[entity_id] = (policy, value, payload)
+        return False
+
+    def forget(self, entity_id: str) -> None:
+        self._last.pop(entity_id, None)
+        self._pending.pop(entity_id, None)
+        self._cancel(entity_id)
+
+    def cancel_all(self) -> None:
+        for cancel in self._timers.values():
+            cancel()
+        self._timers.clear()
+        self._pending.clear()
+
+    def _published(self, entity_id: str, value: Any, now: float) -> None:
+        self._last[entity_id] = (value, now)
+        self._pending.pop(entity_id, None)
+        self._cancel(entity_id)
+
+    def _arm(self, entity_id: str, policy: PublishPolicy, last: Tuple[Any, float], now: float) -> bool:
+        """Make sure a flush is scheduled; False when nothing would flush."""
+        if entity_id in self._timers:
+            return True
+        if self._schedule is None:
+            return False
+        last_ts = last[1]
+        if now - last_ts < policy.min_interval:
+            due = last_ts + policy.min_interval
+        elif policy.heartbeat:
+            due = last_ts + policy.heartbeat
+        else:
+            return False
+        self._timers[entity_id] = self._schedule(max(due - now, 0.0), lambda: self._flush(entity_id))
+        return True
+
+    def _flush(self, entity_id: str) -> None:
+        self._timers.pop(entity_id, None)
+        pending = self._pending.get(entity_id)
+        last = self._last.get(entity_id)
+        if pending is None or last is None:
+            return
+        policy, value, payload = pending
+        now = self._clock()
+        if not self._passes(policy, last, value, now):
+            # Still inside the deadband: wait for the heartbeat, if any.
+            if not self._arm(entity_id, policy, last, now):
+                del self._pending[entity_id]
+            return
+        self._published(entity_id, value, now)
+        self.flushed += 1
+        if self._on_flush is not None:
+            self._on_flush(entity_id, payload)
+
+    def _cancel(self, entity_id: str) -> None:
+        cancel = self._timers.pop(entity_id, None)
+        if cancel is not None:
+            cancel()
+
+    @staticmethod
+    def _passes(policy: PublishPolicy, last: Tuple[Any, float], value: Any, now: float) -> bool:
+        last_value, last_ts = last
+        elapsed = now - last_ts
+        if policy.heartbeat and elapsed >= policy.heartbeat:
+            return True
+        if elapsed < policy.min_interval:
+            return False
+        new, old = _as_number(value), _as_number(last_value)
+        if new is None or old is None:
+            return value != last_value
+        threshold = max(policy.abs_deadband, policy.rel_deadband * abs(old))
+        return abs(new - old) > threshold
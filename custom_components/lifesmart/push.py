@@ -0,0 +1,278 @@
+"""LifeSmart push channel with heartbeat-driven polling failover."""
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import re
+import time
+from datetime import timedelta
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+import aiohttp
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.event import async_track_time_interval
+
+from .const import (
+    DEVICE_DATA_KEY,
+    DEVICE_ID_KEY,
+    DEVICE_TYPE_KEY,
+    HUB_ID_KEY,
+    PUSH_CHECK_INTERVAL,
+    PUSH_HEARTBEAT,
+    PUSH_POLL_INTERVAL,
+    PUSH_STALE_AFTER,
+    SUBDEVICE_INDEX_KEY,
+)
+from .state_store import DeviceStateStore
+
+_LOGGER = logging.getLogger(__name__)
+
+MessageCallback = Callable[[Dict[str, Any]], None]
+PollListener = Callable[[List[Dict[str, Any]]], None]
+
+# Set on frames synthesized from a fallback poll; they are not hub heartbeats.
+POLLED_KEY = "_polled"
+
+# Cheap field probes run on the raw frame text, before any JSON parsing.
+_AGT_RE = re.compile(r'"%s"\s*:\s*"([^"]*)"' % HUB_ID_KEY)
+_DEVTYPE_RE = re.compile(r'"%s"\s*:\s*"([^"]*)"' % DEVICE_TYPE_KEY)
+# permessage-deflate window bits requested from the server
+WS_COMPRESS = 15
+
+
+class LifeSmartPushSupervisor:
+    """Own the WebSocket push channel and fall back to polling per hub.
+
+    A hub is healthy while the socket is up and it has produced a frame
+    within ``stale_after`` seconds. Unhealthy hubs are refreshed from
+    EpGetAll every ``poll_interval`` seconds. Only IOs that differ from the
+    state store (or, without one, from the previous poll) are dispatched;
+    IOs seen for the first time are not. A hub returns to push-only as soon
+    as it is heard from on the socket again, or when a poll finds nothing
+    new while the socket is up: a quiet hub is not a broken one.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        client: Any,
+        hubs: List[str],
+        heartbeat: float = PUSH_HEARTBEAT,
+        stale_after: float = PUSH_STALE_AFTER,
+        poll_interval: float = PUSH_POLL_INTERVAL,
+        exclude_hubs: Optional[List[str]] = None,
+        devtypes: Optional[List[str]] = None,
+        state: Optional[DeviceStateStore] = None,
+    ) -> None:
+        self._hass = hass
+        self._client = client
+        self._hubs = list(hubs)
+        self._heartbeat = heartbeat
+        self._stale_after = stale_after
+        self._poll_interval = poll_interval
+        self._callbacks: List[MessageCallback] = []
+        self._poll_listeners: List[PollListener] = []
+        self._state = state
+        self._connected_at: Optional[float] = None
+        self._last_seen: Dict[str, float] = {}
+        self._polling: Set[str] = set()
+        self._next_poll = 0.0
+        self._poll_task: Optional[asyncio.Task] = None
+        self._snapshot: Dict[Tuple[str, str, str], Tuple[Any, Any]] = {}
+        self._unsubs: List[Callable[[], None]] = []
+        self._exclude_hubs: Set[str] = set()
+        self._devtypes: Optional[Set[str]] = None
+        self.set_filters(exclude_hubs or [], devtypes or [])
+        self.frames = 0
+        self.frames_filtered = 0
+        # Counted after permessage-deflate; aiohttp does not expose wire size.
+        self.text_chars_received = 0
+
+    @property
+    def metrics(self) -> Dict[str, Any]:
+        return {
+            "connected": self._connected_at is not None,
+            "polling_hubs": sorted(self._polling),
+            "frames": self.frames,
+            "frames_filtered": self.frames_filtered,
+            "text_chars_received": self.text_chars_received,
+        }
+
+    def set_filters(self, exclude_hubs: List[str], devtypes: List[str]) -> None:
+        """Drop frames from ``exclude_hubs``; keep only ``devtypes`` when given."""
+        self._exclude_hubs = set(exclude_hubs)
+        self._devtypes = set(devtypes) if devtypes else None
+
+    @property
+    def polling_hubs(self) -> Set[str]:
+        return set(self._polling)
+
+    def is_healthy(self, hub_id: str) -> bool:
+        """True while the socket is up and the hub is not in polling failover."""
+        return self._connected_at is not None and hub_id in self._hubs and hub_id not in self._polling
+
+    def set_hubs(self, hubs: List[str]) -> None:
+        self._hubs = list(hubs)
+        self._polling.intersection_update(self._hubs)
+
+    def add_message_callback(self, cb: MessageCallback) -> None:
+        self._callbacks.append(cb)
+
+    def remove_message_callback(self, cb: MessageCallback) -> None:
+        if cb in self._callbacks:
+            self._callbacks.remove(cb)
+
+    def add_poll_listener(self, cb: PollListener) -> None:
+        """``cb(devices)`` receives every fallback EpGetAll result."""
+        self._poll_listeners.append(cb)
+
+    @callback
+    def async_start(self, entry: ConfigEntry) -> None:
+        entry.async_create_background_task(self._hass, self._run_push(), "lifesmart_push")
+        self._unsubs.append(
+            async_track_time_interval(self._hass, self._check, timedelta(seconds=PUSH_CHECK_INTERVAL))
+        )
+
+    @callback
+    def async_stop(self) -> None:
+        while self._unsubs:
+            self._unsubs.pop()()
+        if self._poll_task is not None:
+            self._poll_task.cancel()
+            self._poll_task = None
+
+    async def _run_push(self) -> None:
+        backoff = 1
+        session = async_get_clientsession(self._hass)
+        while True:
+            try:
+                async with session.ws_connect(
+                    self._client.get_wss_url(), heartbeat=self._heartbeat, compress=WS_COMPRESS
+                ) as ws:
+                    await ws.send_str(self._client.generate_wss_auth())
+                    self._connected_at = time.monotonic()
+                    backoff = 1
+                    _LOGGER.debug("LifeSmart: push channel connected")
+                    async for frame in ws:
+                        if frame.type == aiohttp.WSMsgType.TEXT:
+                            self._handle_frame(frame.data)
+                        elif frame.type in (aiohttp.WSMsgType.CLOSED, aiohttp.WSMsgType.ERROR):
+                            break
+            except (aiohttp.ClientError, TimeoutError, OSError) as exc:
+                _LOGGER.debug("LifeSmart: push channel error: %s", exc)
+            finally:
+                self._connected_at = None
+            self._check()
+            await asyncio.sleep(backoff)
+            backoff = min(backoff * 2, 300)
+
+    def _prefiltered(self, raw: str) -> bool:
+        """True when the raw frame is for a hub or devtype we do not want."""
+        if self._exclude_hubs:
+            match = _AGT_RE.search(raw)
+            if match and match.group(1) in self._exclude_hubs:
+                return True
+        if self._devtypes is not None:
+            match = _DEVTYPE_RE.search(raw)
+            if match and match.group(1) not in self._devtypes:
+                return True
+        return False
+
+    def _handle_frame(self, raw: str) -> None:
+        self.frames += 1
+        self.text_chars_received += len(raw)
+        if self._prefiltered(raw):
+            self.frames_filtered += 1
+            return
+        try:
+            frame = json.loads(raw)
+        except ValueError:
+            return
+        msg = frame.get("msg") if isinstance(frame, dict) else None
+        if not isinstance(msg, dict):
+            return
+        hub_id = msg.get(HUB_ID_KEY)
+        if hub_id:
+            self._last_seen[hub_id] = time.monotonic()
+            if hub_id in self._polling:
+                self._polling.discard(hub_id)
+                _LOGGER.info("LifeSmart: push recovered for hub %s; polling stopped", hub_id)
+        self._dispatch(msg)
+
+    def _dispatch(self, msg: Dict[str, Any]) -> None:
+        for cb in list(self._callbacks):
+            cb(msg)
+
+    @callback
+    def _check(self, _now=None) -> None:
+        now = time.monotonic()
+        for hub_id in self._hubs:
+            if self._connected_at is None:
+                healthy = False
+            else:
+                seen = max(self._last_seen.get(hub_id, 0.0), self._connected_at)
+                healthy = now - seen < self._stale_after
+            if not healthy and hub_id not in self._polling:
+                self._polling.add(hub_id)
+                _LOGGER.warning("LifeSmart: push unhealthy for hub %s; falling back to polling", hub_id)
+        if self._polling and self._poll_task is None and now >= self._next_poll:
+            self._next_poll = now + self._poll_interval
+            self._poll_task = self._hass.async_create_background_task(self._poll(), "lifesmart_push_poll")
+
+    async def _poll(self) -> None:
+        try:
+            devices = await self._client.get_all_device_async()
+        except (aiohttp.ClientError, TimeoutError, OSError, ValueError, KeyError) as exc:
+            _LOGGER.debug("LifeSmart: fallback poll failed: %s", exc)
+            return
+        finally:
+            self._poll_task = None
+        if not isinstance(devices, list):
+            return
+        for cb in list(self._poll_listeners):
+            cb(devices)
+        changed: Set[str] = set()
+        for device in devices:
+            hub_id = device.get(HUB_ID_KEY)
+            if hub_id not in self._polling:
+                continue
+            if self._devtypes is not None and device.get(DEVICE_TYPE_KEY) not in self._devtypes:
+                continue
+            me = device.get(DEVICE_ID_KEY)
+            for idx, io in (device.get(DEVICE_DATA_KEY) or {}).items():
+                if not isinstance(io, dict):
+                    continue
+                key = (hub_id, me, idx)
+                value = (io.get("type"), io.get("val"))
+                previous = self._previous(key)
+                if previous == value:
+                    continue
+                if self._state is None:
+                    self._snapshot[key] = value
+                if previous is None:
+                    continue
+                changed.add(hub_id)
+                self._dispatch({
+                    DEVICE_TYPE_KEY: device.get(DEVICE_TYPE_KEY),
+                    HUB_ID_KEY: hub_id,
+                    DEVICE_ID_KEY: me,
+                    SUBDEVICE_INDEX_KEY: idx,
+                    **io,
+                    POLLED_KEY: True,
+                })
+        if self._connected_at is not None:
+            now = time.monotonic()
+            for hub_id in self._polling - changed:
+                self._last_seen[hub_id] = now
+                _LOGGER.debug("LifeSmart: hub %s quiet but consistent; back to push only", hub_id)
+            self._polling &= changed
+
+    def _previous(self, key: Tuple[str, str, str]) -> Optional[Tuple[Any, Any]]:
+        """Last known (type, val) of an IO, or None when never seen."""
+        if self._state is None:
+            return self._snapshot.get(key)
+        io = self._state.io(*key)
+        return (io.get("type"), io.get("val")) if io is not None else None
@@ -0,0 +1,82 @@
+"""Sampled request/response trace ring buffer."""
+from __future__ import annotations
+
+import random
+import re
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, Optional, Union
+
+# LifeSmart puts "code" first in its replies; only the head is searched.
+_CODE_RE = re.compile(rb'"code"\s*:\s*(-?\d+)')
+_CODE_HEAD = 64
+
+
+def response_code(body: Union[str, bytes]) -> Optional[int]:
+    """API result code of a response body, without parsing the whole body."""
+    head = body[:_CODE_HEAD]
+    if isinstance(head, str):
+        head = head.encode("utf-8", "replace")
+    match = _CODE_RE.search(head)
+    return int(match.group(1)) if match else None
+
+
+class RequestTracer:
+    """Keep the last ``size`` sampled API exchanges.
+
+    Only metadata is kept (method, hub, latency, HTTP status, API code or
+    error, payload sizes); request and response bodies never are. ``should_sample`` is the only
+    per-request cost when a call is not sampled.
+    """
+
+    def __init__(self, size: int, sample_rate: float, rng: Callable[[], float] = random.random) -> None:
+        self._rng = rng
+        self._entries: Deque[Dict[str, Any]] = deque(maxlen=max(int(size), 1))
+        self._sample_rate = 0.0
+        self.configure(size, sample_rate)
+        self.total = 0
+        self.sampled = 0
+
+    def configure(self, size: int, sample_rate: float) -> None:
+        size = max(int(size), 1)
+        if size != self._entries.maxlen:
+            self._entries = deque(self._entries, maxlen=size)
+        self._sample_rate = min(max(float(sample_rate), 0.0), 1.0)
+
+    def should_sample(self) -> bool:
+        self.total += 1
+        if self._sample_rate <= 0.0:
+            return False
+        return self._sample_rate >= 1.0 or self._rng() < self._sample_rate
+
+    def record(
+        self,
+        method: str,
+        hub: Optional[str],
+        latency: float,
+        status: Optional[int],
+        request_bytes: int,
+        response_bytes: int,
+        code: Optional[int] = None,
+        error: Optional[str] = None,
+    ) -> None:
+        self.sampled += 1
+        self._entries.append({
+            "ts": round(time.time(), 3),
+            "method": method,
+            "hub": hub,
+            "latency_ms": round(latency * 1000, 1),
+            "status": status,
+            "code": code,
+            "error": error,
+            "request_bytes": request_bytes,
+            "response_bytes": response_bytes,
+        })
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "sample_rate": self._sample_rate,
+            "total": self.total,
+            "sampled": self.sampled,
+            "entries": list(self._entries),
+        }
@@ -0,0 +1,161 @@
+"""Add or remove entities at runtime without reloading the config entry."""
+from __future__ import annotations
+
+import logging
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.entity import Entity
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+
+from .const import DEVICE_ID_KEY, HUB_ID_KEY, TOPOLOGY_MISSING_REFRESHES
+
+_LOGGER = logging.getLogger(__name__)
+
+DeviceKey = Tuple[str, str]
+EntityFactory = Callable[[Any], Optional[Entity]]
+
+
+def device_key(device: Any) -> Optional[DeviceKey]:
+    if isinstance(device, dict):
+        agt, me = device.get(HUB_ID_KEY), device.get(DEVICE_ID_KEY)
+    else:
+        agt, me = getattr(device, HUB_ID_KEY, None), getattr(device, DEVICE_ID_KEY, None)
+    return (agt, me) if agt and me else None
+
+
+def is_included(bucket: Dict[str, Any], device: Any) -> bool:
+    key = device_key(device)
+    if key is None:
+        return False
+    return key[0] not in bucket.get("exclude_hubs", ()) and key[1] not in bucket.get("exclude_devices", ())
+
+
+@callback
+def async_register_platform(
+    hass: HomeAssistant,
+    bucket: Dict[str, Any],
+    platform: str,
+    async_add_entities: AddEntitiesCallback,
+    factory: EntityFactory,
+) -> None:
+    """Remember a platform's add-entities callback and create its initial entities."""
+    bucket.setdefault("platforms", {})[platform] = (async_add_entities, factory)
+    async_sync_entities(hass, bucket, platforms=[platform])
+
+
+@callback
+def async_sync_entities(hass: HomeAssistant, bucket: Dict[str, Any], platforms=None) -> None:
+    """Bring each platform's entities in line with the included devices.
+
+    Only the difference is touched: entities whose device disappeared or is
+    now excluded are removed, and entities for newly included devices are
+    added through the platform's stored callback.
+    """
+    devices = [d for d in bucket.get("devices") or [] if is_included(bucket, d)]
+    desired: Set[DeviceKey] = {device_key(d) for d in devices}
+    tracked = bucket.setdefault("entities", {})
+    for platform, (async_add_entities, factory) in bucket.get("platforms", {}).items():
+        if platforms is not None and platform not in platforms:
+            continue
+        current: Dict[DeviceKey, Entity] = tracked.setdefault(platform, {})
+        for key in set(current) - desired:
+            entity = current.pop(key)
+            if entity.hass is not None:
+                hass.async_create_task(entity.async_remove())
+        added = []
+        for device in devices:
+            key = device_key(device)
+            if key in current:
+                continue
+            entity = factory(device)
+            if entity is not None:
+                current[key] = entity
+                added.append(entity)
+        if added:
+            # The device list already carries each device's IO snapshot.
+            async_add_entities(added, update_before_add=False)
+        _LOGGER.debug("LifeSmart: %s now has %d entities (+%d)", platform, len(current), len(added))
+
+
+@callback
+def async_apply_device_list(hass: HomeAssistant, bucket: Dict[str, Any], fresh: List[Any]) -> Tuple[int, int]:
+    """Merge a freshly fetched device list into the running entry.
+
+    Devices are compared by (agt, me) only; the state store, scheduler and
+    platform entities are touched just for devices that appeared or
+    disappeared. A device is only removed once it has been missing from
+    TOPOLOGY_MISSING_REFRESHES consecutive lists, and an empty list is
+    ignored, so a short or failed EpGetAll does not drop the fleet.
+    Injected dummy devices are kept. Returns (added, removed).
+    """
+    devices: List[Any] = bucket["devices"]
+    dummies = {device_key(d) for d in bucket.get("dummy_devices") or ()}
+    fresh_by_key = {device_key(d): d for d in fresh if device_key(d) is not None}
+    if not fresh_by_key:
+        _LOGGER.debug("LifeSmart: ignoring empty device list")
+        return 0, 0
+    known = {device_key(d) for d in devices}
+
+    missing: Dict[DeviceKey, int] = bucket.setdefault("missing_devices", {})
+    removed = []
+    for device in devices:
+        key = device_key(device)
+        if key in fresh_by_key or key in dummies:
+            missing.pop(key, None)
+            continue
+        missing[key] = missing.get(key, 0) + 1
+        if missing[key] >= TOPOLOGY_MISSING_REFRESHES:
+            removed.append(device)
+    added = [d for key, d in fresh_by_key.items() if key not in known]
+    if not removed and not added:
+        return 0, 0
+
+    state = bucket.get("state")
+    scheduler = bucket.get("scheduler")
+    for device in removed:
+        devices.remove(device)
+        agt, me = device_key(device)
+        missing.pop((agt, me), None)
+        if state is not None:
+            state.remove(agt, me)
+        if scheduler is not None:
+            scheduler.forget(agt, me)
+    devices.extend(added)
+    if state is not None:
+        state.load(added)
+    async_sync_entities(hass, bucket)
+    _LOGGER.info("LifeSmart: topology changed, %d devices added, %d removed", len(added), len(removed))
+    return len(added), len(removed)
+
+
+@callback
+def async_poll_due(hass: HomeAssistant, bucket: Dict[str, Any]) -> None:
+    """Start ``async_poll`` on every added entity that has one and is not mid-poll.
+
+    Entities decide themselves whether they are due, so a tick that finds
+    nothing due costs no request and no state write. Devices on hubs whose
+    push stream is healthy are skipped: push keeps them current.
+    """
+    in_flight: Set[Tuple[str, DeviceKey]] = bucket.setdefault("polls_in_flight", set())
+    push = bucket.get("push")
+    for platform, entities in bucket.get("entities", {}).items():
+        for key, entity in entities.items():
+            poll = getattr(entity, "async_poll", None)
+            if poll is None or entity.hass is None or (platform, key) in in_flight:
+                continue
+            if push is not None and push.is_healthy(key[0]):
+                continue
+            in_flight.add((platform, key))
+            hass.async_create_background_task(
+                _async_run_poll(poll, (platform, key), in_flight), f"lifesmart_poll_{key[1]}"
+            )
+
+
+async def _async_run_poll(poll: Callable[[], Any], key: Tuple[str, DeviceKey], in_flight: Set) -> None:
+    try:
+        await poll()
+    except Exception as exc:  # noqa: BLE001 - one failing device must not stop the others
+        _LOGGER.debug("LifeSmart: refresh of %s failed: %s", key[1], exc)
+    finally:
+        in_flight.discard(key)
@@ -0,0 +1,62 @@
+"""Adaptive per-device refresh scheduling."""
+from __future__ import annotations
+
+import time
+from typing import Callable, Dict, Tuple
+
+DeviceKey = Tuple[str, str]
+
+
+class AdaptiveRefreshScheduler:
+    """Decide when each (agt, me) device is due for a cloud refresh.
+
+    A device that changed or received a command recently is refreshed at
+    the minimum interval; every refresh that finds nothing new multiplies
+    its interval by ``backoff`` up to the maximum.
+    """
+
+    def __init__(
+        self,
+        min_interval: float,
+        max_interval: float,
+        backoff: float = 2.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._min = float(min_interval)
+        self._max = max(float(max_interval), self._min)
+        self._backoff = max(float(backoff), 1.0)
+        self._clock = clock
+        self._interval: Dict[DeviceKey, float] = {}
+        self._next_due: Dict[DeviceKey, float] = {}
+
+    def set_bounds(self, min_interval: float, max_interval: float) -> None:
+        self._min = float(min_interval)
+        self._max = max(float(max_interval), self._min)
+        for key, interval in self._interval.items():
+            self._interval[key] = min(max(interval, self._min), self._max)
+
+    def is_due(self, agt: str, me: str) -> bool:
+        return self._clock() >= self._next_due.get((agt, me), 0.0)
+
+    def interval(self, agt: str, me: str) -> float:
+        return self._interval.get((agt, me), self._min)
+
+    def record_refresh(self, agt: str, me: str, changed: bool) -> None:
+        """Reschedule after a refresh; ``changed`` tells whether any IO moved."""
+        key = (agt, me)
+        if changed:
+            interval = self._min
+        else:
+            interval = min(self._max, self._interval.get(key, self._min) * self._backoff)
+        self._interval[key] = interval
+        self._next_due[key] = self._clock() + interval
+
+    def record_activity(self, agt: str, me: str) -> None:
+        """A command was sent; poll at the minimum interval again to confirm it."""
+        key = (agt, me)
+        self._interval[key] = self._min
+        self._next_due[key] = min(self._next_due.get(key, 0.0), self._clock() + self._min)
+
+    def forget(self, agt: str, me: str) -> None:
+        self._interval.pop((agt, me), None)
+        self._next_due.pop((agt, me), None)
@@ -0,0 +1,210 @@
+"""LifeSmart integration services."""
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import Any, Dict, List
+
+import voluptuous as vol
+from homeassistant.components import persistent_notification
+from homeassistant.components.climate.const import HVACMode
+from homeassistant.core import HomeAssistant, ServiceCall, ServiceResponse, SupportsResponse, callback
+from homeassistant.exceptions import HomeAssistantError
+import homeassistant.helpers.config_validation as cv
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN, GROUP_MAX_PER_HUB, IR_DEFAULT_PACE
+from .ir import async_send_ir_sequence
+from .profiler import async_profile
+
+SERVICE_PROFILE = "profile"
+SERVICE_SEND_IR_SEQUENCE = "send_ir_sequence"
+SERVICE_QUERY_EVENTS = "query_events"
+SERVICE_AIRBOARD_GROUP_SET = "airboard_group_set"
+
+PROFILE_SCHEMA = vol.Schema({
+    vol.Optional("seconds", default=60): vol.All(vol.Coerce(float), vol.Range(min=1, max=3600)),
+    vol.Optional("block_threshold", default=0.1): vol.All(vol.Coerce(float), vol.Range(min=0.001, max=10)),
+})
+
+_IR_TARGET = {
+    vol.Optional("agt"): cv.string,
+    vol.Optional("me"): cv.string,
+    vol.Optional("ai"): cv.string,
+    vol.Optional("category"): cv.string,
+    vol.Optional("brand"): cv.string,
+}
+
+IR_STEP_SCHEMA = vol.All(
+    vol.Schema({
+        **_IR_TARGET,
+        vol.Exclusive("keys", "payload"): vol.Any(cv.string, [cv.string]),
+        vol.Exclusive("ir_code", "payload"): cv.string,
+        vol.Optional("delay", default=0): vol.All(vol.Coerce(float), vol.Range(min=0, max=60)),
+    }),
+    cv.has_at_least_one_key("keys", "ir_code"),
+)
+
+IR_SEQUENCE_SCHEMA = vol.Schema({
+    **_IR_TARGET,
+    vol.Required("steps"): vol.All(cv.ensure_list, [IR_STEP_SCHEMA], vol.Length(min=1, max=200)),
+    vol.Optional("pace", default=IR_DEFAULT_PACE): vol.All(vol.Coerce(float), vol.Range(min=0, max=10)),
+})
+
+QUERY_EVENTS_SCHEMA = vol.Schema({
+    vol.Optional("agt"): cv.string,
+    vol.Optional("me"): cv.string,
+    vol.Optional("since"): cv.datetime,
+    vol.Optional("until"): cv.datetime,
+    vol.Optional("limit", default=100): vol.All(vol.Coerce(int), vol.Range(min=1, max=1000)),
+})
+
+AIRBOARD_GROUP_SCHEMA = vol.All(
+    vol.Schema({
+        vol.Optional("entity_id"): cv.entity_ids,
+        vol.Optional("hubs"): vol.All(cv.ensure_list, [cv.string]),
+        vol.Optional("hvac_mode"): vol.Coerce(HVACMode),
+        vol.Optional("temperature"): vol.All(vol.Coerce(float), vol.Range(min=16, max=30)),
+        vol.Optional("fan_mode"): vol.In(["low", "medium", "high"]),
+        vol.Optional("max_per_hub", default=GROUP_MAX_PER_HUB): vol.All(vol.Coerce(int), vol.Range(min=1, max=64)),
+    }),
+    cv.has_at_least_one_key("entity_id", "hubs"),
+    cv.has_at_least_one_key("hvac_mode", "temperature", "fan_mode"),
+)
+
+
+def _entry_bucket(hass: HomeAssistant) -> Dict[str, Any]:
+    for bucket in (hass.data.get(DOMAIN) or {}).values():
+        if isinstance(bucket, dict) and bucket.get("client") is not None:
+            return bucket
+    raise HomeAssistantError("No LifeSmart entry with a connected client")
+
+
+def _resolve_ir_steps(data: Dict[str, Any]) -> list:
+    """Fill each step's target from the call-level defaults and validate it."""
+    defaults = {k: data[k] for k in _IR_TARGET if k in data}
+    steps = []
+    for n, raw in enumerate(data["steps"]):
+        step = {**defaults, **raw}
+        missing = [k for k in ("agt", "me") if not step.get(k)]
+        if "keys" in step:
+            missing += [k for k in ("category", "brand") if not step.get(k)]
+        if missing:
+            raise HomeAssistantError(f"IR step {n} is missing {', '.join(missing)}")
+        steps.append(step)
+    return steps
+
+
+async def _async_group_set(bucket: Dict[str, Any], data: Dict[str, Any]) -> Dict[str, Any]:
+    """Fan AirBoard writes out in parallel across hubs, bounded within each hub."""
+    entity_ids = set(data.get("entity_id") or ())
+    hubs = set(data.get("hubs") or ())
+    by_hub: Dict[str, List[Any]] = {}
+    for (agt, _), entity in bucket.get("entities", {}).get("climate", {}).items():
+        if not hasattr(entity, "async_apply_settings"):
+            continue
+        if entity.entity_id in entity_ids or agt in hubs:
+            by_hub.setdefault(agt, []).append(entity)
+
+    results: Dict[str, Dict[str, Any]] = {}
+
+    async def _apply(entity: Any, limit: asyncio.Semaphore) -> None:
+        async with limit:
+            try:
+                await entity.async_apply_settings(
+                    data.get("hvac_mode"), data.get("temperature"), data.get("fan_mode")
+                )
+            except Exception as exc:  # noqa: BLE001 - reported per unit
+                results[entity.entity_id] = {"ok": False, "error": str(exc)}
+            else:
+                results[entity.entity_id] = {"ok": True}
+
+    started = time.monotonic()
+    limits = {agt: asyncio.Semaphore(data["max_per_hub"]) for agt in by_hub}
+    await asyncio.gather(*(
+        _apply(entity, limits[agt]) for agt, entities in by_hub.items() for entity in entities
+    ))
+    failed = sum(1 for r in results.values() if not r["ok"])
+    return {
+        "succeeded": len(results) - failed,
+        "failed": failed,
+        "hubs": len(by_hub),
+        "duration": round(time.monotonic() - started, 3),
+        "units": results,
+    }
+
+
+@callback
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register integration-wide services once per Home Assistant instance."""
+    if hass.services.has_service(DOMAIN, SERVICE_PROFILE):
+        return
+
+    async def _profile(call: ServiceCall) -> ServiceResponse:
+        result = await async_profile(hass, call.data["seconds"], call.data["block_threshold"])
+        persistent_notification.async_create(
+            hass,
+            f"LifeSmart profile saved to `{result['stats_file']}` "
+            f"({result['blocking_events']} blocking events); summary in `{result['summary_file']}`.",
+            title="LifeSmart profile",
+            notification_id=f"{DOMAIN}_profile",
+        )
+        return result
+
+    async def _send_ir_sequence(call: ServiceCall) -> ServiceResponse:
+        bucket = _entry_bucket(hass)
+        client = bucket["client"]
+        if not hasattr(client, "send_ir_key_async") or not hasattr(client, "send_ir_code_async"):
+            raise HomeAssistantError("The LifeSmart client does not support IR transmission")
+        steps = _resolve_ir_steps(call.data)
+        locks = bucket.setdefault("ir_locks", {})
+        result = await async_send_ir_sequence(client, steps, call.data["pace"], locks)
+        hass.bus.async_fire(f"{DOMAIN}_ir_sequence_done", {k: result[k] for k in ("sent", "failed", "duration")})
+        return result
+
+    async def _query_events(call: ServiceCall) -> ServiceResponse:
+        journal = _entry_bucket(hass).get("journal")
+        if journal is None:
+            return {"events": []}
+        since, until = call.data.get("since"), call.data.get("until")
+        events = journal.query(
+            agt=call.data.get("agt"),
+            me=call.data.get("me"),
+            since=dt_util.as_utc(since).timestamp() if since else None,
+            until=dt_util.as_utc(until).timestamp() if until else None,
+            limit=call.data["limit"],
+        )
+        for event in events:
+            event["ts"] = dt_util.utc_from_timestamp(event["ts"]).isoformat()
+        return {"events": events}
+
+    async def _airboard_group_set(call: ServiceCall) -> ServiceResponse:
+        result = await _async_group_set(_entry_bucket(hass), call.data)
+        if not result["units"]:
+            raise HomeAssistantError("No LifeSmart AirBoards matched the given entities or hubs")
+        return result
+
+    hass.services.async_register(
+        DOMAIN, SERVICE_PROFILE, _profile, schema=PROFILE_SCHEMA, supports_response=SupportsResponse.OPTIONAL
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_SEND_IR_SEQUENCE,
+        _send_ir_sequence,
+        schema=IR_SEQUENCE_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_QUERY_EVENTS,
+        _query_events,
+        schema=QUERY_EVENTS_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_AIRBOARD_GROUP_SET,
+        _airboard_group_set,
+        schema=AIRBOARD_GROUP_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
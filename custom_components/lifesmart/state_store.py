@@ -0,0 +1,142 @@
+"""Central per-entry device state store with versioned devices."""
+from __future__ import annotations
+
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Tuple
+
+DeviceKey = Tuple[str, str]
+VersionListener = Callable[[int], None]
+
+
+class DeviceStateStore:
+    """Hold the only copy of IO values, keyed by (agt, me) and then idx.
+
+    Every change to a device bumps its version and notifies that device's
+    subscribers. Producers (poll, push, command) all write here; entities
+    read through a ``DeviceView``. ``load`` adopts the ``data`` dicts of an
+    EpGetAll device list, so the list and the store share one copy.
+    """
+
+    def __init__(self) -> None:
+        self._data: Dict[DeviceKey, Dict[str, dict]] = {}
+        self._versions: Dict[DeviceKey, int] = {}
+        self._listeners: Dict[DeviceKey, List[VersionListener]] = {}
+
+    def __contains__(self, key: DeviceKey) -> bool:
+        return key in self._data
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def load(self, devices: Iterable[Any]) -> None:
+        for device in devices:
+            if not isinstance(device, dict):
+                continue
+            agt, me = device.get("agt"), device.get("me")
+            if not agt or not me:
+                continue
+            data = device.get("data")
+            if not isinstance(data, dict):
+                data = {}
+            device["data"] = data
+            self._data[(agt, me)] = data
+            self._versions.setdefault((agt, me), 0)
+
+    def io(self, agt: str, me: str, idx: str) -> Optional[Mapping[str, Any]]:
+        io = self._data.get((agt, me), {}).get(idx)
+        return MappingProxyType(io) if io is not None else None
+
+    def data(self, agt: str, me: str) -> Mapping[str, dict]:
+        return MappingProxyType(self._data.get((agt, me), {}))
+
+    def version(self, agt: str, me: str) -> int:
+        return self._versions.get((agt, me), 0)
+
+    def update_io(self, agt: str, me: str, idx: str, values: Mapping[str, Any], notify: bool = True) -> bool:
+        """Merge ``values`` into one IO; returns True when anything changed."""
+        data = self._data.setdefault((agt, me), {})
+        io = data.setdefault(idx, {})
+        changed = False
+        for key, value in values.items():
+            if io.get(key, _MISSING) != value:
+                io[key] = value
+                changed = True
+        if changed:
+            self._bump((agt, me), notify)
+        return changed
+
+    def replace(self, agt: str, me: str, snapshot: Mapping[str, Any], notify: bool = True) -> bool:
+        """Replace a device's IOs with a fresh snapshot, in place."""
+        data = self._data.setdefault((agt, me), {})
+        if data == snapshot:
+            return False
+        data.clear()
+        data.update({idx: dict(io) for idx, io in snapshot.items() if isinstance(io, Mapping)})
+        self._bump((agt, me), notify)
+        return True
+
+    def notify(self, agt: str, me: str) -> None:
+        """Notify subscribers of the current version, e.g. after a silent write."""
+        version = self._versions.get((agt, me), 0)
+        for listener in list(self._listeners.get((agt, me), ())):
+            listener(version)
+
+    def remove(self, agt: str, me: str) -> None:
+        self._data.pop((agt, me), None)
+        self._versions.pop((agt, me), None)
+        self._listeners.pop((agt, me), None)
+
+    def subscribe(self, agt: str, me: str, listener: VersionListener) -> Callable[[], None]:
+        listeners = self._listeners.setdefault((agt, me), [])
+        listeners.append(listener)
+
+        def _unsubscribe() -> None:
+            if listener in listeners:
+                listeners.remove(listener)
+
+        return _unsubscribe
+
+    def view(self, agt: str, me: str) -> "DeviceView":
+        self._data.setdefault((agt, me), {})
+        self._versions.setdefault((agt, me), 0)
+        return DeviceView(self, agt, me)
+
+    def _bump(self, key: DeviceKey, notify: bool) -> None:
+        version = self._versions.get(key, 0) + 1
+        self._versions[key] = version
+        if notify:
+            self.notify(*key)
+
+
+_MISSING = object()
+
+
+class DeviceView:
+    """Read-through handle on one device in a DeviceStateStore."""
+
+    __slots__ = ("_store", "agt", "me")
+
+    def __init__(self, store: DeviceStateStore, agt: str, me: str) -> None:
+        self._store = store
+        self.agt = agt
+        self.me = me
+
+    @property
+    def data(self) -> Mapping[str, dict]:
+        return self._store.data(self.agt, self.me)
+
+    @property
+    def version(self) -> int:
+        return self._store.version(self.agt, self.me)
+
+    def io(self, idx: str) -> Optional[Mapping[str, Any]]:
+        return self._store.io(self.agt, self.me, idx)
+
+    def write(self, idx: str, key: str, value: Any) -> bool:
+        return self._store.update_io(self.agt, self.me, idx, {key: value})
+
+    def replace(self, snapshot: Mapping[str, Any]) -> bool:
+        return self._store.replace(self.agt, self.me, snapshot)
+
+    def subscribe(self, listener: VersionListener) -> Callable[[], None]:
+        return self._store.subscribe(self.agt, self.me, listener)
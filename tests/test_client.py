@@ -0,0 +1,42 @@
+import asyncio
+import importlib.util
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+def load_module(name):
+    path = ROOT / "custom_components" / "lifesmart" / f"{name}.py"
+    spec = importlib.util.spec_from_file_location(f"lifesmart_{name}", path)
+    mod = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = mod
+    spec.loader.exec_module(mod)
+    return mod
+
+
+def test_generate_fleet_spreads_devices_over_hubs():
+    client = load_module("client")
+    fleet = client.generate_fleet(6, 3, ["SL_UACCB", "SL_PIR", "SL_NOPE"])
+    assert [d["agt"] for d in fleet] == ["HUB0000000001", "HUB0000000002", "HUB0000000003"] * 2
+    assert [d["devtype"] for d in fleet[:2]] == ["SL_UACCB", "SL_PIR"]
+    assert set(fleet[0]["data"]) == {"P1", "P2", "P3", "P4", "P6"}
+    assert fleet == client.generate_fleet(6, 3, ["SL_UACCB", "SL_PIR"])
+
+
+def test_synthetic_events_change_the_state_store():
+    client = load_module("client")
+    store_mod = load_module("state_store")
+    synthetic = client.SyntheticClient(20, 2, ["SL_UACCB", "SL_SC_THL"], event_rate=0)
+    store = store_mod.DeviceStateStore()
+    store.load(asyncio.run(synthetic.async_get_devices()))
+    notified = []
+    for agt, me in {(d["agt"], d["me"]) for d in synthetic._devices}:
+        store.subscribe(agt, me, notified.append)
+    changed = 0
+    for _ in range(200):
+        msg = synthetic._random_change()
+        values = {k: msg[k] for k in ("type", "val") if k in msg}
+        changed += store.update_io(msg["agt"], msg["me"], msg["idx"], values)
+    assert changed > 0
+    assert len(notified) == changed
@@ -0,0 +1,94 @@
+import asyncio
+import importlib.util
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+def load_queue_module():
+    path = ROOT / "custom_components" / "lifesmart" / "command_queue.py"
+    spec = importlib.util.spec_from_file_location("lifesmart_command_queue", path)
+    mod = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(mod)
+    return mod
+
+
+def epset(idx, val, me="DEV1"):
+    return {"agt": "HUB1", "me": me, "idx": idx, "type": 0x88, "val": val}
+
+
+def test_superseded_writes_collapse_to_latest():
+    mod = load_queue_module()
+    sent = []
+
+    async def send(params):
+        sent.append((params["idx"], params["val"]))
+        return 0
+
+    async def run():
+        queue = mod.DeviceCommandQueue(0.01, ("P3", "P4"))
+        results = await asyncio.gather(*(queue.submit(epset("P3", v), send) for v in (220, 225, 230, 235)))
+        assert results == [0, 0, 0, 0]
+
+    asyncio.run(run())
+    assert sent == [("P3", 235)]
+
+
+def test_non_collapsible_writes_are_serialized_in_order():
+    mod = load_queue_module()
+    sent = []
+
+    async def send(params):
+        sent.append((params["idx"], params["val"]))
+        await asyncio.sleep(0)
+        return 0
+
+    async def run():
+        queue = mod.DeviceCommandQueue(0.0, ("P3",))
+        await asyncio.gather(
+            queue.submit(epset("P1", 1), send),
+            queue.submit(epset("P2", 3), send),
+            queue.submit(epset("P2", 4), send),
+        )
+
+    asyncio.run(run())
+    assert sent == [("P1", 1), ("P2", 3), ("P2", 4)]
+
+
+def test_send_error_reaches_every_collapsed_caller():
+    mod = load_queue_module()
+
+    async def send(params):
+        raise RuntimeError("boom")
+
+    async def run():
+        queue = mod.DeviceCommandQueue(0.0, ("P4",))
+        results = await asyncio.gather(
+            queue.submit(epset("P4", 15), send),
+            queue.submit(epset("P4", 75), send),
+            return_exceptions=True,
+        )
+        assert all(isinstance(r, RuntimeError) for r in results)
+        assert queue.pending_count("HUB1", "DEV1") == 0
+
+    asyncio.run(run())
+
+
+def test_collapsed_write_keeps_its_queue_position():
+    mod = load_queue_module()
+    sent = []
+
+    async def send(params):
+        sent.append((params["idx"], params["val"]))
+        return 0
+
+    async def run():
+        queue = mod.DeviceCommandQueue(0.01, ("P3",))
+        await asyncio.gather(
+            queue.submit(epset("P3", 1), send),
+            queue.submit(epset("P1", 1), send),
+            queue.submit(epset("P3", 2), send),
+        )
+
+    asyncio.run(run())
+    assert sent == [("P3", 2), ("P1", 1)]
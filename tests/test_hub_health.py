@@ -0,0 +1,57 @@
+import importlib.util
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+def load_health_module():
+    path = ROOT / "custom_components" / "lifesmart" / "hub_health.py"
+    spec = importlib.util.spec_from_file_location("lifesmart_hub_health", path)
+    mod = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = mod
+    spec.loader.exec_module(mod)
+    return mod
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_errors_flip_whole_hub_once():
+    mod = load_health_module()
+    health = mod.HubHealthTracker(error_threshold=3, probe_interval=60, clock=FakeClock())
+    flips = []
+    health.add_listener(lambda agt, online, entities: flips.append((agt, online, sorted(entities))))
+    health.register("HUB1", "climate.a")
+    unregister = health.register("HUB1", "climate.b")
+    health.register("HUB2", "climate.c")
+
+    for _ in range(5):
+        health.record_error("HUB1")
+    assert flips == [("HUB1", False, ["climate.a", "climate.b"])]
+    assert health.offline_hubs == ["HUB1"]
+    assert health.is_online("HUB2")
+
+    unregister()
+    health.record_heartbeat("HUB1")
+    assert flips[-1] == ("HUB1", True, ["climate.a"])
+    assert len(flips) == 2
+
+
+def test_offline_hubs_are_probed_sparingly():
+    mod = load_health_module()
+    clock = FakeClock()
+    health = mod.HubHealthTracker(error_threshold=1, probe_interval=60, clock=clock)
+    assert health.should_probe("HUB1")
+    health.record_status("HUB1", False)
+    assert health.should_probe("HUB1")
+    assert not health.should_probe("HUB1")
+    clock.now += 60
+    assert health.should_probe("HUB1")
+    health.record_success("HUB1")
+    assert health.should_probe("HUB1") and health.should_probe("HUB1")
@@ -0,0 +1,98 @@
+import asyncio
+import importlib.util
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+def load_ingest_module():
+    path = ROOT / "custom_components" / "lifesmart" / "ingest.py"
+    spec = importlib.util.spec_from_file_location("lifesmart_ingest", path)
+    mod = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = mod
+    spec.loader.exec_module(mod)
+    return mod
+
+
+def frame(me, idx, val):
+    return {"devtype": "SL_OE_3C", "agt": "HUB1", "me": me, "idx": idx, "val": val}
+
+
+def test_coalesce_keeps_every_frame_below_capacity():
+    mod = load_ingest_module()
+    seen = []
+    queue = mod.PushIngestQueue(seen.append, maxsize=5000, batch_size=10, policy="coalesce")
+    queue.put(frame("DEV1", "M", 1))
+    queue.put(frame("DEV1", "M", 0))
+    assert queue.drain() == 2
+    assert [m["val"] for m in seen] == [1, 0]
+    assert queue.metrics["coalesced"] == 0
+
+
+def test_coalesce_folds_into_latest_frame_when_full():
+    mod = load_ingest_module()
+    seen = []
+    queue = mod.PushIngestQueue(seen.append, maxsize=2, batch_size=10, policy="coalesce")
+    for val in range(5):
+        queue.put(frame("DEV1", "P1", val))
+    assert queue.metrics["coalesced"] == 3
+    queue.put(frame("DEV2", "P1", 0))
+    queue.drain()
+    assert [(m["me"], m["val"]) for m in seen] == [("DEV1", 4), ("DEV2", 0)]
+    assert queue.metrics["dropped"] == 1
+
+
+def test_drop_oldest_prefers_same_device():
+    mod = load_ingest_module()
+    seen = []
+    queue = mod.PushIngestQueue(seen.append, maxsize=3, batch_size=10, policy="drop_oldest")
+    queue.put(frame("DEV1", "P1", 1))
+    queue.put(frame("DEV2", "P1", 1))
+    queue.put(frame("DEV2", "P1", 2))
+    queue.put(frame("DEV2", "P1", 3))
+    queue.drain()
+    assert [(m["me"], m["val"]) for m in seen] == [("DEV1", 1), ("DEV2", 2), ("DEV2", 3)]
+    assert queue.dropped == 1
+
+
+def test_worker_drains_in_batches_and_survives_handler_errors():
+    mod = load_ingest_module()
+    seen = []
+
+    def handler(msg):
+        if msg["val"] == 3:
+            raise ValueError("bad frame")
+        seen.append(msg["val"])
+
+    async def run():
+        queue = mod.PushIngestQueue(handler, maxsize=100, batch_size=4, policy="drop_oldest")
+        worker = asyncio.ensure_future(queue.run())
+        for val in range(10):
+            queue.put(frame("DEV1", "P1", val))
+        await asyncio.sleep(0)
+        assert len(queue) == 6
+        for _ in range(3):
+            await asyncio.sleep(0)
+        worker.cancel()
+        return queue
+
+    queue = asyncio.run(run())
+    assert seen == [0, 1, 2, 4, 5, 6, 7, 8, 9]
+    assert queue.metrics["processed"] == 10
+
+
+def test_policy_switch_keeps_queued_frames():
+    mod = load_ingest_module()
+    seen = []
+    queue = mod.PushIngestQueue(seen.append, maxsize=3, batch_size=10, policy="drop_oldest")
+    queue.put(frame("DEV1", "P1", 1))
+    queue.put(frame("DEV2", "P1", 1))
+    queue.put(frame("DEV1", "P1", 2))
+    queue.set_policy("coalesce")
+    queue.put(frame("DEV1", "P1", 3))
+    queue.set_policy("drop_oldest")
+    queue.put(frame("DEV2", "P1", 2))
+    queue.drain()
+    assert [(m["me"], m["val"]) for m in seen] == [("DEV1", 1), ("DEV1", 3), ("DEV2", 2)]
+    assert (queue.coalesced, queue.dropped) == (1, 1)
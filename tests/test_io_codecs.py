@@ -0,0 +1,79 @@
+import importlib.util
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+def load_codecs():
+    path = ROOT / "custom_components" / "lifesmart" / "io_codecs.py"
+    spec = importlib.util.spec_from_file_location("lifesmart_io_codecs", path)
+    mod = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = mod
+    spec.loader.exec_module(mod)
+    return mod
+
+
+def test_airboard_snapshot_decodes_once():
+    codecs = load_codecs()
+    state = codecs.decode("SL_UACCB", {
+        "P1": {"type": 0x81},
+        "P2": {"val": 3},
+        "P3": {"val": 240},
+        "P4": {"val": 45},
+        "P6": {"val": 250},
+    })
+    assert state.power is True
+    assert state.mode == 3
+    assert state.target_temperature == 24.0
+    assert state.current_temperature == 25.0
+    assert state.fan_mode == "medium"
+
+
+def test_missing_ios_and_unknown_devtypes_read_as_none():
+    codecs = load_codecs()
+    state = codecs.decode("SL_UACCB", {"P1": {"type": 0x80}})
+    assert state.power is False
+    assert state.target_temperature is None
+
+def test_unknown_attributes_raise():
+    codecs = load_codecs()
+    state = codecs.decode("SL_UACCB", {"P3": {"val": 240}})
+    for bad in (lambda: state.targt_temperature, lambda: state.motion,
+                lambda: codecs.decode("SL_NOPE", {"P1": {"val": 1}}).power):
+        try:
+            bad()
+        except AttributeError:
+            continue
+        raise AssertionError("expected AttributeError")
+    assert type(state).__name__ == "SlUaccbState"
+
+
+def test_generic_controllers_share_the_airboard_table():
+    codecs = load_codecs()
+    for devtype in ("SL_UACC", "SL_CTRL"):
+        assert codecs.decode(devtype, {"P3": {"val": 215}}).target_temperature == 21.5
+
+
+def test_encode_uses_table():
+    codecs = load_codecs()
+    assert codecs.encode("SL_UACCB", "target_temperature", 23.5) == ("P3", 235)
+    assert codecs.encode("SL_UACCB", "fan_mode", "high") == ("P4", 75)
+
+
+def test_tenths_keeps_fractional_raw_values():
+    codecs = load_codecs()
+    assert codecs.decode("SL_UACCB", {"P6": {"val": 251.6}}).current_temperature == 25.2
+
+
+def test_sensor_and_lock_tables():
+    codecs = load_codecs()
+    assert codecs.decode("SL_GUARD", {"G": {"val": 0}}).opened is True
+    assert codecs.decode("SL_GUARD", {"G": {"val": 1}}).opened is False
+    assert codecs.decode("SL_PIR", {"M": {"val": 1}}).motion is True
+    assert codecs.decode("SL_DET", {"M": {"val": 0}}).motion is False
+    assert codecs.decode("SL_SMK", {"P1": {"val": 1}}).alarm is True
+    assert codecs.decode("SL_GAS", {"P1": {"val": 0}}).alarm is False
+    assert codecs.decode("SL_WTR", {"WA": {"val": 2}}).leak is True
+    lock = codecs.decode("SL_LOCK", {"EVTLO": {"val": 4121}, "BAT": {"val": 87}})
+    assert (lock.lock_event, lock.battery) == (4121, 87)
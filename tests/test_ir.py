@@ -0,0 +1,50 @@
+import asyncio
+import importlib.util
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+def load_ir_module():
+    path = ROOT / "custom_components" / "lifesmart" / "ir.py"
+    spec = importlib.util.spec_from_file_location("lifesmart_ir", path)
+    mod = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = mod
+    spec.loader.exec_module(mod)
+    return mod
+
+
+class SlowFirstClient:
+    """The first code takes longer than the pace; later ones are instant."""
+
+    def __init__(self):
+        self.events = []
+
+    async def send_ir_code_async(self, agt, me, code):
+        self.events.append(("start", agt, code))
+        await asyncio.sleep(0.05 if code == "power" else 0)
+        self.events.append(("done", agt, code))
+        return {"code": 0}
+
+
+def step(agt, code):
+    return {"agt": agt, "me": "IR1", "ir_code": code}
+
+
+def test_steps_on_one_hub_never_overtake_each_other():
+    mod = load_ir_module()
+    client = SlowFirstClient()
+    steps = [step("HUB1", "power"), step("HUB1", "input3"), step("HUB2", "power")]
+    result = asyncio.run(mod.async_send_ir_sequence(client, steps, 0.01, {}))
+    hub1 = [e for e in client.events if e[1] == "HUB1"]
+    assert hub1 == [
+        ("start", "HUB1", "power"),
+        ("done", "HUB1", "power"),
+        ("start", "HUB1", "input3"),
+        ("done", "HUB1", "input3"),
+    ]
+    # Hubs still run in parallel: HUB2 starts before HUB1's first step ends.
+    assert client.events.index(("start", "HUB2", "power")) < client.events.index(("done", "HUB1", "power"))
+    assert [r["index"] for r in result["steps"]] == [0, 1, 2]
+    assert result["sent"] == 3
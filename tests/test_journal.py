@@ -0,0 +1,48 @@
+import importlib.util
+import json
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+def load_journal_module():
+    path = ROOT / "custom_components" / "lifesmart" / "journal.py"
+    spec = importlib.util.spec_from_file_location("lifesmart_journal", path)
+    mod = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = mod
+    spec.loader.exec_module(mod)
+    return mod
+
+
+def test_ring_buffer_is_bounded_per_device_and_by_device_count():
+    mod = load_journal_module()
+    journal = mod.EventJournal(per_device=3, max_devices=2)
+    for n in range(10):
+        journal.record("HUB1", "LOCK1", "SL_LOCK", "EVTLO", "E_LOCK", n, ts=n)
+    journal.record("HUB1", "DOOR1", "SL_GUARD", "G", "E_SECURITY", 0, ts=20)
+    journal.record("HUB1", "PIR1", "SL_PIR", "M", "E_SECURITY", 1, ts=30)
+    assert len(journal) == 2
+    assert journal.query(me="LOCK1") == []
+    assert [e["me"] for e in journal.query()] == ["PIR1", "DOOR1"]
+
+
+def test_query_filters_by_device_and_window():
+    mod = load_journal_module()
+    journal = mod.EventJournal(per_device=3, max_devices=10)
+    for n in range(5):
+        journal.record("HUB1", "LOCK1", "SL_LOCK", "EVTLO", "E_LOCK", n, ts=100 + n)
+    journal.record("HUB2", "LOCK2", "SL_LOCK", "ALM", "E_ALARM", 1, ts=103)
+    assert [e["val"] for e in journal.query(me="LOCK1")] == [4, 3, 2]
+    assert [e["agt"] for e in journal.query(since=103, until=103)] == ["HUB1", "HUB2"]
+    assert len(journal.query(limit=1)) == 1
+
+
+def test_spill_appends_compact_lines(tmp_path):
+    mod = load_journal_module()
+    path = tmp_path / "events.jsonl"
+    journal = mod.EventJournal(per_device=3, max_devices=10, spill_path=str(path))
+    journal.record("HUB1", "LOCK1", "SL_LOCK", "EVTLO", "E_LOCK", 1, ts=1.5)
+    assert journal.flush() == 1
+    assert journal.flush() == 0
+    assert json.loads(path.read_text()) == [1.5, "HUB1", "LOCK1", "SL_LOCK", "EVTLO", "E_LOCK", 1]
@@ -0,0 +1,33 @@
+import importlib
+import sys
+import types
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+def load_client_module():
+    pytest.importorskip("aiohttp")
+    # Load the module inside a bare package so its relative imports resolve
+    # without running the integration's __init__ (which needs Home Assistant).
+    pkg = types.ModuleType("lifesmart_pkg")
+    pkg.__path__ = [str(ROOT / "custom_components" / "lifesmart")]
+    sys.modules["lifesmart_pkg"] = pkg
+    return importlib.import_module("lifesmart_pkg.lifesmart_client")
+
+
+def test_decode_epgetall_keeps_good_devices_only():
+    mod = load_client_module()
+    raw = b'{"code":0,"message":[{"agt":"A","me":"1","data":{"P1":{"v":1}}},{"agt":"A","me":"2"},7]}'
+    response = mod._decode_epgetall(raw)
+    assert [d["me"] for d in response["message"]] == ["1", "2"]
+    assert response["message"][1]["data"] == {}
+
+
+def test_decode_epgetall_passes_errors_and_non_objects_through():
+    mod = load_client_module()
+    assert mod._decode_epgetall(b'{"code":10004,"message":"token expired"}')["code"] == 10004
+    assert mod._decode_epgetall(b"null") is None
+    assert mod._decode_epgetall(b"[1, 2]") == [1, 2]
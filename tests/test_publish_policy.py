@@ -0,0 +1,137 @@
+import importlib.util
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+def load_policy_module():
+    path = ROOT / "custom_components" / "lifesmart" / "publish_policy.py"
+    spec = importlib.util.spec_from_file_location("lifesmart_publish_policy", path)
+    mod = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = mod
+    spec.loader.exec_module(mod)
+    return mod
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def make_gate(**policy):
+    mod = load_policy_module()
+    clock = FakeClock()
+    gate = mod.PublishGate({"SL_OE_3C": mod.PublishPolicy(**policy)}, {}, clock=clock)
+    return gate, clock
+
+
+def test_abs_deadband_suppresses_small_moves():
+    gate, clock = make_gate(abs_deadband=1.0)
+    assert gate.should_publish("SL_OE_3C", "e1", 100)
+    assert not gate.should_publish("SL_OE_3C", "e1", 100.5)
+    assert not gate.should_publish("SL_OE_3C", "e1", 101.0)
+    assert gate.should_publish("SL_OE_3C", "e1", 101.5)
+    assert gate.suppressed == 2
+
+
+def test_min_interval_and_heartbeat():
+    gate, clock = make_gate(min_interval=5, heartbeat=60)
+    assert gate.should_publish("SL_OE_3C", "e1", 1)
+    clock.now = 2
+    assert not gate.should_publish("SL_OE_3C", "e1", 2)
+    clock.now = 6
+    assert gate.should_publish("SL_OE_3C", "e1", 2)
+    clock.now = 30
+    assert not gate.should_publish("SL_OE_3C", "e1", 2)
+    clock.now = 66
+    assert gate.should_publish("SL_OE_3C", "e1", 2)
+
+
+def test_relative_deadband_and_unmanaged_devtypes():
+    gate, _ = make_gate(rel_deadband=0.1)
+    assert gate.should_publish("SL_OE_3C", "e1", 200)
+    assert not gate.should_publish("SL_OE_3C", "e1", 215)
+    assert gate.should_publish("SL_OE_3C", "e1", 225)
+    assert gate.should_publish("SL_SW", "e2", 1)
+    assert gate.should_publish("SL_SW", "e2", 1)
+
+
+class FakeTimers:
+    def __init__(self, clock):
+        self.clock = clock
+        self.calls = []
+
+    def __call__(self, delay, action):
+        entry = [self.clock.now + delay, action]
+        self.calls.append(entry)
+        return lambda: self.calls.remove(entry) if entry in self.calls else None
+
+    def advance(self, now):
+        self.clock.now = now
+        for entry in sorted(self.calls, key=lambda e: e[0]):
+            if entry[0] <= now and entry in self.calls:
+                self.calls.remove(entry)
+                entry[1]()
+
+
+def make_timed_gate(**policy):
+    mod = load_policy_module()
+    clock = FakeClock()
+    timers = FakeTimers(clock)
+    gate = mod.PublishGate({"SL_OE_3C": mod.PublishPolicy(**policy)}, {}, clock=clock, schedule=timers)
+    flushed = []
+    gate.set_flush_handler(lambda entity_id, payload: flushed.append((entity_id, payload)))
+    return gate, timers, flushed
+
+
+def test_suppressed_jump_is_flushed_when_min_interval_ends():
+    gate, timers, flushed = make_timed_gate(abs_deadband=5, min_interval=5)
+    assert gate.should_publish("SL_OE_3C", "e1", 10, "first")
+    timers.advance(1)
+    assert not gate.should_publish("SL_OE_3C", "e1", 2000, "jump")
+    timers.advance(5)
+    assert flushed == [("e1", "jump")]
+    assert not timers.calls
+
+
+def test_deadband_value_waits_for_heartbeat_and_publish_cancels_flush():
+    gate, timers, flushed = make_timed_gate(abs_deadband=5, heartbeat=60)
+    assert gate.should_publish("SL_OE_3C", "e1", 10, "a")
+    timers.advance(10)
+    assert not gate.should_publish("SL_OE_3C", "e1", 12, "b")
+    timers.advance(59)
+    assert flushed == []
+    timers.advance(60)
+    assert flushed == [("e1", "b")]
+    assert not gate.should_publish("SL_OE_3C", "e1", 13, "c")
+    assert gate.should_publish("SL_OE_3C", "e1", 30, "d")
+    assert not timers.calls
+
+
+def test_policy_overrides_parse_format_and_take_precedence():
+    mod = load_policy_module()
+    text = "DEV0001/P2: abs_deadband=5 min_interval=10; DEV0002: heartbeat=60"
+    overrides = mod.parse_policy_overrides(text)
+    assert overrides == {"DEV0001/P2": {"abs_deadband": 5.0, "min_interval": 10.0}, "DEV0002": {"heartbeat": 60.0}}
+    assert mod.parse_policy_overrides(mod.format_policy_overrides(overrides)) == overrides
+    gate = mod.PublishGate(
+        {"SL_OE_3C": mod.PublishPolicy(abs_deadband=1)},
+        {k: mod.PublishPolicy.from_dict(v) for k, v in overrides.items()},
+    )
+    assert gate.policy_for("SL_OE_3C", ("DEV0001/P2", "DEV0001")).abs_deadband == 5
+    assert gate.policy_for("SL_OE_3C", ("DEV0002/P1", "DEV0002")).heartbeat == 60
+    assert gate.policy_for("SL_OE_3C", ("DEV0003/P1", "DEV0003")).abs_deadband == 1
+
+
+def test_policy_overrides_reject_unknown_settings():
+    mod = load_policy_module()
+    for bad in ("DEV0001 abs_deadband=5", "DEV0001: deadband=5", "DEV0001: min_interval=soon"):
+        try:
+            mod.parse_policy_overrides(bad)
+        except ValueError:
+            continue
+        raise AssertionError(bad)
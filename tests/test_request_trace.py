@@ -0,0 +1,55 @@
+import importlib.util
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+def load_trace_module():
+    path = ROOT / "custom_components" / "lifesmart" / "request_trace.py"
+    spec = importlib.util.spec_from_file_location("lifesmart_request_trace", path)
+    mod = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = mod
+    spec.loader.exec_module(mod)
+    return mod
+
+
+def test_sampling_and_ring_bound():
+    mod = load_trace_module()
+    rolls = iter([0.01, 0.5, 0.02, 0.9, 0.03, 0.04])
+    tracer = mod.RequestTracer(size=2, sample_rate=0.1, rng=lambda: next(rolls))
+    for n in range(6):
+        if tracer.should_sample():
+            tracer.record("api.EpSet", "HUB1", 0.1 * n, 200, 100, 20)
+    snap = tracer.snapshot()
+    assert snap["total"] == 6
+    assert snap["sampled"] == 4
+    assert [e["latency_ms"] for e in snap["entries"]] == [400.0, 500.0]
+
+
+def test_zero_rate_never_samples_and_configure_resizes():
+    mod = load_trace_module()
+    tracer = mod.RequestTracer(size=5, sample_rate=0)
+    assert not any(tracer.should_sample() for _ in range(100))
+    for n in range(5):
+        tracer.record("api.EpGet", None, 0, 200, 1, 1)
+    tracer.configure(2, 1.0)
+    assert tracer.should_sample()
+    assert len(tracer.snapshot()["entries"]) == 2
+
+
+def test_response_code_reads_api_code_from_body_head():
+    mod = load_trace_module()
+    assert mod.response_code('{"code":0,"message":[]}') == 0
+    assert mod.response_code(b'{"code": -10002, "message": "bad sign"}') == -10002
+    assert mod.response_code(b"<html>502</html>") is None
+
+
+def test_failed_requests_are_recorded_with_error():
+    mod = load_trace_module()
+    tracer = mod.RequestTracer(size=5, sample_rate=1.0)
+    tracer.record("api.EpGet", "HUB1", 0.2, None, 10, 0, error="ClientConnectorError")
+    tracer.record("api.EpSet", "HUB1", 0.1, 200, 10, 30, code=10005)
+    entries = tracer.snapshot()["entries"]
+    assert (entries[0]["status"], entries[0]["error"]) == (None, "ClientConnectorError")
+    assert (entries[1]["status"], entries[1]["code"]) == (200, 10005)
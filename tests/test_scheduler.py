@@ -0,0 +1,59 @@
+import importlib.util
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+def load_scheduler_module():
+    path = ROOT / "custom_components" / "lifesmart" / "scheduler.py"
+    spec = importlib.util.spec_from_file_location("lifesmart_scheduler", path)
+    mod = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(mod)
+    return mod
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def make(min_interval=30, max_interval=240):
+    clock = FakeClock()
+    mod = load_scheduler_module()
+    return mod.AdaptiveRefreshScheduler(min_interval, max_interval, clock=clock), clock
+
+
+def test_new_device_is_due():
+    sched, _ = make()
+    assert sched.is_due("HUB1", "DEV1")
+
+
+def test_idle_device_backs_off_to_max():
+    sched, clock = make()
+    intervals = []
+    for _ in range(5):
+        sched.record_refresh("HUB1", "DEV1", changed=False)
+        intervals.append(sched.interval("HUB1", "DEV1"))
+    assert intervals == [60, 120, 240, 240, 240]
+    clock.now += 239
+    assert not sched.is_due("HUB1", "DEV1")
+    clock.now += 1
+    assert sched.is_due("HUB1", "DEV1")
+
+
+def test_change_and_activity_reset_interval():
+    sched, clock = make()
+    for _ in range(3):
+        sched.record_refresh("HUB1", "DEV1", changed=False)
+    sched.record_refresh("HUB1", "DEV1", changed=True)
+    assert sched.interval("HUB1", "DEV1") == 30
+
+    for _ in range(3):
+        sched.record_refresh("HUB1", "DEV1", changed=False)
+    sched.record_activity("HUB1", "DEV1")
+    assert sched.interval("HUB1", "DEV1") == 30
+    clock.now += 30
+    assert sched.is_due("HUB1", "DEV1")
@@ -0,0 +1,46 @@
+import importlib.util
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+def load_store_module():
+    path = ROOT / "custom_components" / "lifesmart" / "state_store.py"
+    spec = importlib.util.spec_from_file_location("lifesmart_state_store", path)
+    mod = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = mod
+    spec.loader.exec_module(mod)
+    return mod
+
+
+def test_load_shares_the_device_list_copy():
+    mod = load_store_module()
+    devices = [{"agt": "HUB1", "me": "DEV1", "data": {"P3": {"val": 240}}}]
+    store = mod.DeviceStateStore()
+    store.load(devices)
+    store.update_io("HUB1", "DEV1", "P3", {"val": 250})
+    assert devices[0]["data"]["P3"]["val"] == 250
+    assert store.version("HUB1", "DEV1") == 1
+
+
+def test_views_see_every_producer_and_get_version_bumps():
+    mod = load_store_module()
+    store = mod.DeviceStateStore()
+    store.load([{"agt": "HUB1", "me": "DEV1", "data": {}}])
+    view = store.view("HUB1", "DEV1")
+    seen = []
+    unsubscribe = view.subscribe(seen.append)
+
+    assert view.write("P1", "type", 0x81)
+    assert not store.update_io("HUB1", "DEV1", "P1", {"type": 0x81})
+    assert view.replace({"P1": {"type": 0x80}, "P2": {"val": 3}})
+    assert not view.replace({"P1": {"type": 0x80}, "P2": {"val": 3}})
+    assert seen == [1, 2]
+    assert view.io("P2")["val"] == 3
+
+    store.update_io("HUB1", "DEV1", "P2", {"val": 4}, notify=False)
+    unsubscribe()
+    store.update_io("HUB1", "DEV1", "P2", {"val": 5})
+    assert seen == [1, 2]
+    assert view.version == 4